@@ -0,0 +1,142 @@
+"""Benchmarks the tips data path without a Firebase project.
+
+The tips live in a LocalTipsRepository, which answers the same queries
+MainApp sends to Firestore. For every dataset size it measures:
+
+    insert   committing all tips in write queue sized batches
+    status   committing status updates (with the aggregate increments)
+    fetch    the first page, a page halfway down and a one-user page
+    sync     pulling the newest 1% of tips into a fresh TipsCache
+    render   turning every tip into table rows (TipsTable.set_tips)
+    rows     re-filling a screenful of recycled row widgets with other tips
+
+With --filters it instead times the TextInput filters and their original
+re.sub versions on a keystroke-sized and a paste-sized text
+(test_filters.py checks that both agree).
+
+Usage:
+    python benchmark.py
+    python benchmark.py --sizes 1000 5000 --repeat 5
+    python benchmark.py --filters
+"""
+import os
+os.environ.setdefault('KIVY_NO_ARGS', '1')  # Keep Kivy away from our command line
+
+import argparse
+import random
+import time
+
+from main import (LocalTipsRepository, TipsCache, TipsTable, TipRow, MAX_BATCH_WRITES, TIPS_PAGE_SIZE,
+                  new_document_id)
+from test_filters import FILTERS, FILTER_ALPHABET
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+USERS = [f"user{i}" for i in range(20)]
+SPORTS = ["Football", "Tennis", "Basketball", "Hockey"]
+STATUS_UPDATES = 1000
+VISIBLE_ROWS = 20  # Rows on screen at once
+
+def make_tip_data(rng):
+    """Returns one random tip as the insert form would build it."""
+    return {
+        'user': rng.choice(USERS),
+        'team1': f"Team {rng.randrange(200)}",
+        'team2': f"Team {rng.randrange(200)}",
+        'competition': f"League {rng.randrange(30)}",
+        'value': float(rng.randrange(1, 100)),
+        'odd': round(rng.uniform(1.1, 5.0), 2),
+        'bet': rng.choice(["1", "X", "2", "Over 2.5"]),
+        'sport': rng.choice(SPORTS),
+        'date': f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+        'live': rng.random() < 0.2,
+        'status': 'Pending',
+    }
+
+def commit_in_batches(repository, ops):
+    for start in range(0, len(ops), MAX_BATCH_WRITES):
+        repository.commit(ops[start:start + MAX_BATCH_WRITES])
+
+def best_of(repeat, fn):
+    """Runs `fn` `repeat` times and returns the fastest run in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(size, repeat, rng):
+    """Returns [(measurement, milliseconds)] for a dataset of `size` tips."""
+    results = []
+    repository = LocalTipsRepository()
+
+    inserts = [{'op': 'insert', 'id': new_document_id(), 'data': make_tip_data(rng)} for _ in range(size)]
+    results.append(('insert (all)', best_of(1, lambda: commit_in_batches(repository, inserts))))
+
+    tips = repository.fetch_page(None, None, size)
+    updates = [
+        {'op': 'status', 'id': tip.id, 'status': rng.choice(['Win', 'Loose']),
+         'user': tip.user, 'value': tip.value, 'odd': tip.odd, 'previous_status': tip.status}
+        for tip in rng.sample(tips, min(size, STATUS_UPDATES))
+    ]
+    results.append((f'status ({len(updates)})', best_of(1, lambda: commit_in_batches(repository, updates))))
+
+    middle = tips[len(tips) // 2].page_key
+    results.append(('fetch first page', best_of(repeat, lambda: repository.fetch_page(None, None, TIPS_PAGE_SIZE))))
+    results.append(('fetch middle page', best_of(repeat, lambda: repository.fetch_page(None, middle, TIPS_PAGE_SIZE))))
+    results.append(('fetch user page', best_of(repeat, lambda: repository.fetch_page(USERS[0], None, TIPS_PAGE_SIZE))))
+
+    since = tips[max(size // 100, 1) - 1].inserted_at
+    def sync():
+        TipsCache(':memory:').upsert_tips(repository.fetch_inserted_after(since))
+    results.append(('sync newest 1%', best_of(repeat, sync)))
+
+    table = TipsTable()
+    results.append(('render (all rows)', best_of(repeat, lambda: table.set_tips(tips))))
+
+    # What the RecycleView does while scrolling: the same widgets, new data
+    rows = [TipRow() for _ in range(VISIBLE_ROWS)]
+    data = table.recycle_view.data
+    def refresh():
+        for offset in range(0, min(len(data), VISIBLE_ROWS * 10), VISIBLE_ROWS):
+            for i, row in enumerate(rows):
+                index = (offset + i) % len(data)
+                row.refresh_view_attrs(table.recycle_view, index, data[index])
+    results.append((f'rows ({VISIBLE_ROWS} x 10)', best_of(repeat, refresh)))
+    return results
+
+def run_filters(repeat, rng):
+    """Returns [(measurement, milliseconds)] for the original and the compiled filters."""
+    keystroke = "7"  # TextInput passes only the inserted text to its filter
+    paste = ''.join(rng.choice(FILTER_ALPHABET) for _ in range(100000))
+    results = []
+    for name, new, original in FILTERS:
+        for label, text, calls in (('keystroke x1000', keystroke, 1000), ('100k paste', paste, 1)):
+            for version, fn in (('original', original), ('compiled', new)):
+                def call(fn=fn, text=text, calls=calls):
+                    for _ in range(calls):
+                        fn(text, False)
+                results.append((f'{name} {label} {version}', best_of(repeat, call)))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Dataset sizes (number of tips)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per read measurement; the best one is reported")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for the generated tips")
+    parser.add_argument('--filters', action='store_true', help="Time the TextInput filters instead")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.filters:
+        for name, elapsed in run_filters(args.repeat, rng):
+            print(f"{name:<46}{elapsed:>10.3f} ms")
+        return
+    print(f"{'tips':>8}  {'measurement':<20}{'ms':>10}")
+    for size in args.sizes:
+        for name, elapsed in run(size, args.repeat, rng):
+            print(f"{size:>8}  {name:<20}{elapsed:>10.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+"""
+Times finding the new names of paths (what --path*, --paths-from-file and
+friends do to every path in history) for growing numbers of rules, with the
+compiled PathChanges and with the rule-by-rule loop it replaced.  Before
+timing anything it checks that both agree on random rules and paths.
+
+Usage (from the top of the git-filter-repo tree):
+  PYTHONPATH=. t/perf/path-changes-scaling.py
+  PYTHONPATH=. t/perf/path-changes-scaling.py --rules 100 1000 --paths 5000
+"""
+
+import argparse
+import fnmatch
+import os
+import random
+import re
+import time
+
+import git_filter_repo as fr
+
+# The loop PathChanges replaced; PathChanges must agree with it exactly
+def filename_matches(path_expression, pathname):
+  if path_expression == b'':
+    return True
+  n = len(path_expression)
+  if (pathname.startswith(path_expression) and
+      (path_expression[n-1:n] == b'/' or
+       len(pathname) == n or
+       pathname[n:n+1] == b'/')):
+    return True
+  return False
+
+def original_newname(path_changes, pathname, use_base_name,
+                     filtering_is_inclusive):
+  wanted = False
+  full_pathname = pathname
+  if use_base_name:
+    pathname = os.path.basename(pathname)
+  for (mod_type, match_type, path_exp) in path_changes:
+    if mod_type == 'filter' and not wanted:
+      if match_type == 'match' and filename_matches(path_exp, pathname):
+        wanted = True
+      if match_type == 'glob' and fnmatch.fnmatch(pathname, path_exp):
+        wanted = True
+      if match_type == 'regex' and path_exp.search(pathname):
+        wanted = True
+    elif mod_type == 'rename':
+      match, repl = path_exp
+      if match_type == 'match' and filename_matches(match, full_pathname):
+        full_pathname = full_pathname.replace(match, repl, 1)
+        pathname = full_pathname
+      if match_type == 'regex':
+        full_pathname = match.sub(repl, full_pathname)
+        pathname = full_pathname
+  return full_pathname if (wanted == filtering_is_inclusive) else None
+
+# Small alphabets so that random rules and paths actually meet
+NAMES = [b'a', b'b', b'src', b'lib', b'x.c', b'y.py', b'a.c']
+GLOBS = [b'*', b'?', b'*.c', b'[ab]', b'[!a]*', b's*c', b'a/*', b'[']
+REGEXES = [br'\.c$', br'^a/', br'(b|lib)/', br'(?i)SRC', br'y\.', br'^$',
+           br'(?P<n>a)/(?P=n)']
+
+def random_path(rng, names=NAMES, depth=4):
+  return b'/'.join(rng.choice(names) for _ in range(rng.randrange(1, depth+1)))
+
+def random_rules(rng, count, renames):
+  rules = []
+  for _ in range(count):
+    kind = rng.randrange(5 if renames else 3)
+    if kind == 0:
+      path = rng.choice([b'', random_path(rng, depth=2),
+                         random_path(rng, depth=2) + b'/'])
+      rules.append(('filter', 'match', path))
+    elif kind == 1:
+      glob = b'/'.join(rng.choice(NAMES + GLOBS)
+                       for _ in range(rng.randrange(1, 3)))
+      rules.append(('filter', 'glob', glob))
+    elif kind == 2:
+      rules.append(('filter', 'regex', re.compile(rng.choice(REGEXES))))
+    elif kind == 3:
+      old = rng.choice([b'', random_path(rng, depth=2)])
+      new = random_path(rng, depth=2)
+      if old.endswith(b'/') or (old and rng.random() < 0.5):
+        old, new = old + b'/', new + b'/'
+      elif not old:
+        new += b'/'
+      rules.append(('rename', 'match', (old, new)))
+    else:
+      regex = re.compile(rng.choice([br'^(a)/', br'\.c$', br'b']))
+      rules.append(('rename', 'regex', (regex, rng.choice([b'z/', b'.h']))))
+  return rules
+
+def check(cases, rng):
+  ''' Compares PathChanges with the original loop on `cases` random rule
+      sets; raises AssertionError on a mismatch. '''
+  for _ in range(cases):
+    use_base_name = rng.random() < 0.2
+    rules = random_rules(rng, rng.randrange(12), not use_base_name)
+    inclusive = rng.random() < 0.7
+    path_changes = fr.PathChanges(rules, use_base_name, inclusive)
+    for _ in range(20):
+      path = random_path(rng)
+      expected = original_newname(rules, path, use_base_name, inclusive)
+      got = path_changes.newname(path)
+      assert got == expected, (rules, path, use_base_name, inclusive)
+
+def monorepo_paths(rng, count):
+  return sorted(set(
+    b'services/svc%d/%s/file%d.%s' % (rng.randrange(5000),
+                                     rng.choice([b'src', b'test', b'lib']),
+                                     rng.randrange(50),
+                                     rng.choice([b'py', b'c', b'md']))
+    for _ in range(count)))
+
+def scaling_rules(kind, count, rng):
+  ''' What a --paths-from-file carving services out of a monorepo has. '''
+  services = rng.sample(range(5000), min(count, 5000))
+  services = [services[i % len(services)] for i in range(count)]
+  rules = []
+  for i, n in enumerate(services):
+    if kind == 'match':
+      rules.append(('filter', 'match', b'services/svc%d/file%d.py' % (n, i)))
+    elif kind == 'glob':
+      rules.append(('filter', 'glob', b'services/svc%d/*/file%d.*' % (n, i)))
+    elif kind == 'regex':
+      rules.append(('filter', 'regex',
+                    re.compile(br'^services/svc%d/.*file%d\.' % (n, i))))
+    else:
+      rules.append(('rename', 'match', (b'services/svc%d/src%d/' % (n, i),
+                                        b'svc%d/' % n)))
+  if kind == 'rename':
+    rules.append(('filter', 'match', b'services/'))
+  return rules
+
+def best_of(repeat, fn):
+  best = None
+  for _ in range(repeat):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    best = elapsed if best is None else min(best, elapsed)
+  return best
+
+def main():
+  parser = argparse.ArgumentParser(
+      description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--rules', type=int, nargs='+',
+                      default=[1, 10, 100, 1000, 10000, 50000],
+                      help="Numbers of rules to time")
+  parser.add_argument('--paths', type=int, default=2000,
+                      help="Number of distinct paths to look up")
+  parser.add_argument('--kinds', nargs='+',
+                      default=['match', 'glob', 'regex', 'rename'],
+                      help="Kinds of rules to time")
+  parser.add_argument('--max-original-rules', type=int, default=10000,
+                      help="Don't time the original loop beyond this many "
+                           "rules (it takes minutes)")
+  parser.add_argument('--repeat', type=int, default=3,
+                      help="Runs per measurement; the best one is reported")
+  parser.add_argument('--cases', type=int, default=5000,
+                      help="Random rule sets to check first")
+  parser.add_argument('--seed', type=int, default=1)
+  args = parser.parse_args()
+
+  rng = random.Random(args.seed)
+  check(args.cases, rng)
+  print("PathChanges matches the original on %d random rule sets"
+        % args.cases)
+
+  paths = monorepo_paths(rng, args.paths)
+  print("%-8s %8s %14s %14s" % ('kind', 'rules', 'original (s)',
+                                'compiled (s)'))
+  for kind in args.kinds:
+    for count in args.rules:
+      rules = scaling_rules(kind, count, rng)
+      def compiled():
+        path_changes = fr.PathChanges(rules, False, True)
+        return [path_changes.newname(path) for path in paths]
+      def original():
+        return [original_newname(rules, path, False, True) for path in paths]
+      compiled_time = best_of(args.repeat, compiled)
+      original_time = '-'
+      if count <= args.max_original_rules:
+        assert original() == compiled()
+        original_time = '%.3f' % best_of(1, original)
+      print("%-8s %8d %14s %14.3f" % (kind, count, original_time,
+                                      compiled_time))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+"""
+Times git filter-repo --replace-text on a generated repository for several
+values of --jobs, reporting the wall time of each run.  Every run filters a
+fresh clone of the same repository, and all runs must produce the same
+history.
+
+Usage (from anywhere):
+  t/perf/replace-text-jobs.py
+  t/perf/replace-text-jobs.py --jobs 1 2 4 8 --commits 200 --blobs 50
+"""
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+FILTER_REPO = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', '..', 'git-filter-repo')
+WORDS = [b'alpha', b'beta', b'gamma', b'delta', b'password', b'secret',
+         b'token', b'lorem', b'ipsum', b'dolor']
+
+def git(*args, **kwargs):
+  return subprocess.run(('git',) + args, check=True, **kwargs)
+
+def create_repo(path, commits, blobs, blob_size, rng):
+  ''' Creates a repository with `commits` commits changing `blobs` files of
+      about `blob_size` bytes each. '''
+  git('init', '-q', '-b', 'main', path)
+  stream = []
+  for i in range(commits):
+    for j in range(blobs):
+      data = b' '.join(rng.choice(WORDS) for _ in range(blob_size // 6))
+      stream.append(b'blob\nmark :%d\ndata %d\n%s\n'
+                    % (i*blobs + j + 1, len(data), data))
+    stream.append(b'commit refs/heads/main\n'
+                  b'committer A U Thor <a@example.com> %d +0000\n'
+                  b'data 7\ncommit\n' % (1500000000 + i))
+    for j in range(blobs):
+      stream.append(b'M 100644 :%d dir%d/file%d\n'
+                    % (i*blobs + j + 1, j % 10, j))
+    stream.append(b'\n')
+  git('-C', path, 'fast-import', '--quiet', input=b''.join(stream))
+  git('-C', path, 'reset', '-q', '--hard')
+
+def run(source, workdir, expressions, jobs):
+  ''' Filters a fresh clone of source; returns (seconds, resulting tree). '''
+  clone = os.path.join(workdir, 'jobs-%d' % jobs)
+  git('clone', '-q', '--no-local', source, clone)
+  started = time.perf_counter()
+  subprocess.run([sys.executable, FILTER_REPO, '--quiet', '--replace-text',
+                  expressions, '--jobs', str(jobs)], cwd=clone, check=True,
+                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  elapsed = time.perf_counter() - started
+  tree = git('-C', clone, 'rev-parse', 'main^{tree}',
+             stdout=subprocess.PIPE).stdout.strip()
+  shutil.rmtree(clone)
+  return elapsed, tree
+
+def main():
+  parser = argparse.ArgumentParser(
+      description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4],
+                      help="Values of --jobs to time")
+  parser.add_argument('--commits', type=int, default=100)
+  parser.add_argument('--blobs', type=int, default=40,
+                      help="Files changed by every commit")
+  parser.add_argument('--blob-size', type=int, default=20000)
+  parser.add_argument('--seed', type=int, default=1)
+  args = parser.parse_args()
+
+  rng = random.Random(args.seed)
+  with tempfile.TemporaryDirectory() as workdir:
+    source = os.path.join(workdir, 'source')
+    create_repo(source, args.commits, args.blobs, args.blob_size, rng)
+    expressions = os.path.join(workdir, 'expressions')
+    with open(expressions, 'bw') as f:
+      f.write(b'password==>***REMOVED***\n'
+              b'secret\n'
+              b'regex:tok(en)==>T\\1\n')
+
+    print("%d commits, %d blobs of %d bytes (%d CPUs)"
+          % (args.commits, args.commits * args.blobs, args.blob_size,
+             os.cpu_count() or 1))
+    print("%6s %10s" % ('jobs', 'wall (s)'))
+    trees = set()
+    for jobs in args.jobs:
+      elapsed, tree = run(source, workdir, expressions, jobs)
+      trees.add(tree)
+      print("%6d %10.2f" % (jobs, elapsed))
+    assert len(trees) == 1, "--jobs changed the result"
+
+if __name__ == '__main__':
+  main()
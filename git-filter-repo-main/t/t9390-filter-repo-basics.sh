@@ -40,6 +40,7 @@ filter_testcase basic basic-filename --invert-paths --path-glob 't*en*'
 filter_testcase basic basic-numbers  --invert-paths --path-regex 'f.*e.*e'
 filter_testcase basic basic-mailmap  --mailmap ../t9390/sample-mailmap
 filter_testcase basic basic-replace  --replace-text ../t9390/sample-replace
+filter_testcase basic basic-replace  --replace-text ../t9390/sample-replace --jobs 3
 filter_testcase basic basic-message  --replace-message ../t9390/sample-message
 filter_testcase empty empty-keepme   --path keepme
 filter_testcase empty more-empty-keepme --path keepme --prune-empty=always \
@@ -84,6 +85,38 @@ setup_path_rename() {
 	)
 }
 
+test_expect_success '--replace-text --jobs with blobs inserted by callbacks' '
+	setup_path_rename &&
+	(
+		git clone file://"$(pwd)"/path_rename jobs_insert &&
+		cd jobs_insert &&
+
+		cat >../insert-blob.py <<-\EOF &&
+		import sys
+		import git_filter_repo as fr
+
+		def add_file(commit, metadata):
+		  blob = fr.Blob(b"a mod from " + commit.original_id + b"\n")
+		  flt.insert(blob)
+		  commit.file_changes.append(fr.FileChange(b"M", b"inserted",
+		                                           blob.id, b"100644"))
+
+		args = fr.FilteringOptions.parse_args(sys.argv[1:])
+		flt = fr.RepoFilter(args, commit_callback = add_file)
+		flt.run()
+		EOF
+
+		echo "a modified-by-gremlins from $(git rev-parse HEAD)" >../expect &&
+		PYTHONPATH=$(dirname $TEST_DIRECTORY)${PYTHONPATH:+:$PYTHONPATH} \
+			python3 ../insert-blob.py --quiet \
+			--replace-text "$DATA/sample-replace" --jobs 4 &&
+		git show HEAD:inserted >../actual &&
+		test_cmp ../expect ../actual &&
+		git log --format=%H -- inserted >../commits &&
+		test_line_count = 4 ../commits
+	)
+'
+
 test_expect_success '--path-rename sequences/tiny:sequences/small' '
 	setup_path_rename &&
 	(
@@ -188,6 +221,43 @@ test_expect_success '--paths-from-file' '
 	)
 '
 
+test_expect_success '--paths-from-file with many rules' '
+	setup_path_rename &&
+	(
+		git clone file://"$(pwd)"/path_rename paths_from_file_many &&
+		cd paths_from_file_many &&
+
+		for i in $(test_seq 1 1000)
+		do
+			echo unrelated/$i &&
+			echo glob:unrelated/*$i &&
+			echo "regex:^unrelated/$i\$" &&
+			echo "unrelated/$i/==>elsewhere/$i/" || return 1
+		done >../path_changes &&
+		cat >>../path_changes <<-EOF &&
+		sequences/==>seq/
+		seq/tiny==>seq/small
+		literal:seq/small
+		glob:values/*e
+		regex:^seq/me
+		values/large==>big
+		EOF
+
+		git filter-repo --paths-from-file ../path_changes &&
+		git log --format=%n --name-only | sort | uniq >filenames &&
+		# small, medium, huge, big, and a blank line
+		test_line_count = 5 filenames &&
+		! grep sequences/ filenames &&
+		grep seq/small filenames &&
+		grep seq/medium filenames &&
+		grep values/huge filenames &&
+		grep ^big filenames &&
+		! grep values/large filenames &&
+
+		rm ../path_changes
+	)
+'
+
 test_expect_success '--paths does not mean --paths-from-file' '
 	setup_path_rename &&
 	(
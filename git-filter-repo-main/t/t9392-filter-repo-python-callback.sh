@@ -157,6 +157,103 @@ test_expect_success '--file-info-callback acting like --blob-callback' '
 	)
 '
 
+test_expect_success '--file-info-callback with many blobs at once' '
+	setup fileinfo-many &&
+	(
+		cd fileinfo-many &&
+		git filter-repo --file-info-callback "
+		    ids = [blob_id, b\"HEAD:missing-file\", blob_id]
+		    sizes = list(value.get_sizes_many(ids))
+		    contents = list(value.get_contents_many(ids))
+		    assert contents[1] is None and contents[2] == contents[0]
+		    assert sizes == [len(contents[0]), None, len(contents[0])]
+
+		    # An abandoned iteration must not confuse later requests
+		    next(value.get_sizes_many(ids))
+		    assert value.get_contents_by_identifier(blob_id) == contents[0]
+		    return (filename, mode, blob_id)" &&
+		git log --format=%n --name-only | sort | uniq | grep -v ^$ >f &&
+		test_line_count = 5 f
+	)
+'
+
+test_expect_success '--cache-file-info' '
+	test_create_repo cache-file-info &&
+	(
+		cd cache-file-info &&
+		echo one >file &&
+		git add file &&
+		git commit -m one &&
+		echo two >file &&
+		git commit -am two &&
+		echo one >file &&
+		git commit -am "one again" &&
+
+		cat >../upcase <<-\EOF &&
+		print("called back for", filename.decode())
+		contents = value.get_contents_by_identifier(blob_id)
+		new_blob_id = value.insert_file_with_contents(contents.upper())
+		return (filename, mode, new_blob_id)
+		EOF
+		git clone file://"$(pwd)" ../cache-file-info-uncached &&
+		git -C ../cache-file-info-uncached filter-repo --force \
+			--file-info-callback ../upcase >uncached &&
+		git filter-repo --force --cache-file-info \
+			--file-info-callback ../upcase >cached &&
+		grep "called back" uncached >uncached-calls &&
+		test_line_count = 3 uncached-calls &&
+		grep "called back" cached >cached-calls &&
+		test_line_count = 2 cached-calls &&
+
+		git rev-parse HEAD >expect &&
+		git -C ../cache-file-info-uncached rev-parse HEAD >actual &&
+		test_cmp expect actual
+	)
+'
+
+test_expect_success '--cache-file-info with --state-branch' '
+	test_create_repo cache-file-info-state-orig &&
+	test_create_repo cache-file-info-state &&
+	(
+		cd cache-file-info-state-orig &&
+		echo one >file &&
+		git add file &&
+		git commit -m one &&
+		echo two >file &&
+		git commit -am two &&
+
+		cat >../one-executable <<-\EOF &&
+		print("called back for", filename.decode())
+		if value.get_contents_by_identifier(blob_id).startswith(b"one"):
+		  mode = b"100755"
+		return (filename, mode, blob_id)
+		EOF
+
+		cd ../cache-file-info-state &&
+		git fetch ../cache-file-info-state-orig master &&
+		git reset --hard FETCH_HEAD &&
+		git filter-repo --force --cache-file-info \
+			--file-info-callback ../one-executable \
+			--state-branch state_info --refs master >first &&
+		grep "called back" first >first-calls &&
+		test_line_count = 2 first-calls &&
+
+		# Only the new commit is filtered, with the saved results
+		git -C ../cache-file-info-state-orig revert --no-edit HEAD &&
+		git fetch ../cache-file-info-state-orig master &&
+		git reset --hard FETCH_HEAD &&
+		git filter-repo --force --cache-file-info \
+			--file-info-callback ../one-executable \
+			--state-branch state_info --refs master >second &&
+		! grep "called back" second &&
+
+		git log --format=%s >actual-log &&
+		test_line_count = 3 actual-log &&
+		git ls-tree master file >actual &&
+		grep ^100755 actual
+	)
+'
+
 test_expect_success '--commit-callback' '
 	setup commit-callback &&
 	(
@@ -796,6 +796,38 @@ test_expect_success 'lfs: partial history rewrite affecting orphaning' '
 	)
 '
 
+test_expect_success 'lfs: partial rewrite with pointers in subdirectories' '
+	test_create_repo lfs_partial_subdirs &&
+	(
+		cd lfs_partial_subdirs &&
+		git symbolic-ref HEAD refs/heads/main &&
+		echo "L* filter=lfs diff=lfs merge=lfs -text" >.gitattributes &&
+		mkdir "sub dir" &&
+		for id in aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa \
+			  bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb
+		do
+			printf "version https://git-lfs.github.com/spec/v1\noid sha256:$id\nsize 1\n" >"sub dir/L$id" || return 1
+		done &&
+		test_seq 1 500 >"sub dir/big" &&
+		git add . &&
+		git commit -m pointers &&
+		echo more >other &&
+		git add other &&
+		git commit -m other &&
+
+		git filter-repo --sensitive-data-removal --path other --invert-paths \
+		                --refs HEAD~1..HEAD --force &&
+
+		cat <<-EOF >orig_expect &&
+		sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa
+		sha256:bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb
+		EOF
+
+		test_cmp orig_expect .git/filter-repo/original_lfs_objects &&
+		test_must_be_empty .git/filter-repo/orphaned_lfs_objects
+	)
+'
+
 test_expect_success 'lfs: full rewrite then partial' '
 	test_create_repo lfs_full_then_partial &&
 	(
@@ -659,6 +659,65 @@ test_expect_success '--replace-text all options' '
 	)
 '
 
+test_expect_success '--replace-text with --jobs' '
+	setup_analyze_me &&
+	(
+		git clone file://"$(pwd)"/analyze_me replace_text_serial &&
+		git clone file://"$(pwd)"/analyze_me replace_text_jobs &&
+
+		cat >replace-rules-jobs <<-\EOF &&
+		other
+		literal:spam==>foodstuff
+		regex:1(.[0-9])==>2\1
+		EOF
+
+		cd replace_text_serial &&
+		git filter-repo --quiet --replace-text ../replace-rules-jobs \
+			--blob-callback "print(\"blob\", blob.original_id.decode())" >../serial-out &&
+		cd ../replace_text_jobs &&
+		git filter-repo --quiet --replace-text ../replace-rules-jobs --jobs 3 \
+			--blob-callback "print(\"blob\", blob.original_id.decode())" >../jobs-out &&
+		cd .. &&
+		grep ^blob serial-out >serial-blobs &&
+		grep ^blob jobs-out >jobs-blobs &&
+		test_line_count -gt 5 serial-blobs &&
+
+		# Same history, and blob callbacks ran in the same order
+		git -C replace_text_serial rev-parse --all >expect &&
+		git -C replace_text_jobs rev-parse --all >actual &&
+		test_cmp expect actual &&
+		test_cmp serial-blobs jobs-blobs
+	)
+'
+
+test_expect_success '--replace-text with many literals' '
+	test_create_repo replace_many &&
+	(
+		cd replace_many &&
+		printf "key1 key2 key3\nkept\n" >secrets &&
+		git add secrets &&
+		git commit -m initial &&
+
+		# Enough literals for them to be searched for all at once
+		test_seq 1 1500 | sed -e "s/^/unused-secret-/" >../replace-rules-many &&
+		cat >>../replace-rules-many <<-\EOF &&
+		key2
+		literal:key3==>k3
+		regex:k(3)==>K\1
+		EOF
+
+		git filter-repo --force --replace-text ../replace-rules-many &&
+		printf "key1 ***REMOVED*** K3\nkept\n" >expect &&
+		git show HEAD:secrets >actual &&
+		test_cmp expect actual
+	)
+'
+
+test_expect_success '--jobs must not be negative' '
+	test_must_fail git filter-repo --replace-text /dev/null --jobs -1 2>err &&
+	test_i18ngrep "must not be negative" err
+'
+
 test_expect_success '--replace-text binary zero_byte-0_char' '
 	(
 		set -e
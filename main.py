@@ -1,5 +1,15 @@
 import os
 import re
+import json
+import time
+import random
+import string
+import sqlite3
+import bisect
+import csv
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+STARTUP_STARTED = time.perf_counter()  # Kivy's imports are part of the startup being measured
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
@@ -7,67 +17,349 @@ from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.spinner import Spinner
 from kivy.uix.popup import Popup
-from kivy.uix.gridlayout import GridLayout
-from kivy.graphics import Color, RoundedRectangle, Rectangle
+from kivy.graphics import Color, RoundedRectangle, Rectangle, InstructionGroup
 from kivy.metrics import dp
 from kivy.core.window import Window
 from kivy.clock import Clock
 import threading
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.widget import Widget
-
-import firebase_admin
-from firebase_admin import credentials, firestore
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from contextlib import contextmanager
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.screenmanager import ScreenManager, Screen, NoTransition
 
 # --- Configuration ---
 SERVICE_ACCOUNT_KEY_PATH = "revelo-512ee-firebase-adminsdk-jvu9y-179785bc1f.json"  # UPDATE THIS PATH
+STORAGE_BACKEND = os.environ.get('TIPS_BACKEND', 'firestore')  # 'local' runs on LocalTipsRepository, no Firebase needed
+FRAME_TIMES = bool(os.environ.get('TIPS_FRAME_TIMES'))  # Print frame time statistics while the app runs
+UI_TRACE_PATH = os.environ.get('TIPS_TRACE')  # Write the UI timing export (JSON) here when the app stops
+OVERLAY_KEY = 293  # F12 toggles the timing overlay
+EXPORT_KEY = 292  # F11 writes the timing export right away
+
+# --- Startup Timing ---
+class StartupTimer:
+    """Records when each startup phase finished, relative to the start of this module's imports.
+
+    The report is printed once every phase in PHASES has been marked; marks
+    may come from any thread.
+    """
+    PHASES = ('imports', 'first_frame', 'first_data', 'backend_ready')
+
+    def __init__(self, started):
+        self.started = started
+        self.marks = {}
+        self._lock = threading.Lock()
+
+    def mark(self, phase):
+        with self._lock:
+            if phase in self.marks:
+                return
+            self.marks[phase] = time.perf_counter() - self.started
+            complete = all(p in self.marks for p in self.PHASES)
+        if complete:
+            print(self.report())
+
+    def report(self):
+        lines = ["Startup timing (seconds since launch):"]
+        for phase in sorted(self.marks, key=self.marks.get):
+            lines.append(f"  {phase:<16}{self.marks[phase]:8.3f}")
+        return "\n".join(lines)
+
+startup_timer = StartupTimer(STARTUP_STARTED)
+
+# --- UI Instrumentation ---
+def timing_stats(seconds):
+    """Returns count, avg, p95 and max (in milliseconds) of a list of durations in seconds."""
+    times = sorted(seconds)
+    if not times:
+        return {'count': 0, 'avg_ms': None, 'p95_ms': None, 'max_ms': None}
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    return {
+        'count': len(times),
+        'avg_ms': round(sum(times) / len(times) * 1000, 2),
+        'p95_ms': round(p95 * 1000, 2),
+        'max_ms': round(times[-1] * 1000, 2),
+    }
+
+class FrameTimer:
+    """Collects the time between frames from Kivy's Clock.
+
+    The last `keep` frames feed the overlay and the export. With `verbose`,
+    a summary is also printed every `interval` seconds (TIPS_FRAME_TIMES).
+    """
+
+    def __init__(self, interval=5.0, keep=600, verbose=False):
+        self.interval = interval
+        self.verbose = verbose
+        self.recent = deque(maxlen=keep)
+        self.frame_times = []  # Frames since the last printed summary
+        self._event = None
+
+    @property
+    def running(self):
+        return self._event is not None
+
+    def start(self):
+        if self._event is None:
+            self._event = Clock.schedule_interval(self._on_frame, 0)  # Called once per frame
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _on_frame(self, dt):
+        self.recent.append(dt)
+        if not self.verbose:
+            return
+        self.frame_times.append(dt)
+        if sum(self.frame_times) >= self.interval:
+            print(self.report(self.frame_times))
+            self.frame_times = []
+
+    def stats(self):
+        return timing_stats(self.recent)
+
+    def report(self, frame_times=None):
+        stats = timing_stats(self.recent if frame_times is None else frame_times)
+        if not stats['count']:
+            return "Frame times: no frames"
+        return (f"Frame times over {stats['count']} frames: avg {stats['avg_ms']:.1f} ms, "
+                f"p95 {stats['p95_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
+
+class Interaction:
+    """One user action (e.g. pressing 'Tips') and the timed spans it caused."""
+
+    def __init__(self, name, info):
+        self.name = name
+        self.info = info
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.ended = None
+        self.spans = []  # (phase, start, end, thread name)
+
+    def duration(self):
+        return None if self.ended is None else self.ended - self.started
+
+    def phase_totals(self):
+        """Returns {phase: total seconds}, in the order the phases first appeared."""
+        totals = {}
+        for phase, start, end, _ in self.spans:
+            totals[phase] = totals.get(phase, 0) + end - start
+        return totals
+
+    def to_dict(self):
+        duration = self.duration()
+        return {
+            'name': self.name,
+            'info': self.info,
+            'started_at': self.started_at,
+            'total_ms': None if duration is None else round(duration * 1000, 2),
+            'spans': [
+                {'phase': phase, 'start_ms': round((start - self.started) * 1000, 2),
+                 'duration_ms': round((end - start) * 1000, 2), 'thread': thread}
+                for phase, start, end, thread in self.spans
+            ],
+        }
+
+class UiTrace:
+    """Records how long it takes from a user action to the frame that shows its data.
+
+    `begin()` starts an interaction; work done for it is wrapped in
+    `span(phase)` ('fetch', 'model', 'widgets', ...) from any thread, and
+    `finish()` closes it once the first frame with the data was drawn. Spans
+    recorded after that (e.g. a background sync) are still kept with it.
+    """
+    MAX_INTERACTIONS = 100
+
+    def __init__(self):
+        self.interactions = deque(maxlen=self.MAX_INTERACTIONS)
+        self.current = None
+        self._lock = threading.Lock()
+
+    def begin(self, name, **info):
+        interaction = Interaction(name, info)
+        with self._lock:
+            self.interactions.append(interaction)
+            self.current = interaction
+        return interaction
+
+    @contextmanager
+    def span(self, phase, interaction=None):
+        interaction = interaction or self.current
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if interaction is not None:
+                self.add_span(interaction, phase, start, time.perf_counter())
+
+    def add_span(self, interaction, phase, start, end):
+        with self._lock:
+            interaction.spans.append((phase, start, end, threading.current_thread().name))
+
+    def finish(self, interaction):
+        with self._lock:
+            if interaction.ended is None:
+                interaction.ended = time.perf_counter()
+
+    def last_finished(self):
+        with self._lock:
+            for interaction in reversed(self.interactions):
+                if interaction.ended is not None:
+                    return interaction
+        return None
+
+    def to_dict(self, frame_timer=None):
+        with self._lock:
+            interactions = [interaction.to_dict() for interaction in self.interactions]
+        return {
+            'version': 1,
+            'exported_at': time.time(),
+            'startup': {phase: round(seconds * 1000, 2) for phase, seconds in startup_timer.marks.items()},
+            'frames': frame_timer.stats() if frame_timer else None,
+            'interactions': interactions,
+        }
+
+    def export(self, path, frame_timer=None):
+        """Writes the recorded timings to `path` as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(frame_timer), f, indent=2)
+
+ui_trace = UiTrace()
+
+class TimingOverlay(Label):
+    """Small always-on-top label with the frame times and the last interaction's breakdown."""
+
+    def __init__(self, frame_timer, **kwargs):
+        super().__init__(
+            text='', font_size='12sp', size_hint=(None, None), size=(dp(360), dp(60)),
+            halign='left', valign='top', color=(1, 1, 0.6, 1), **kwargs
+        )
+        self.text_size = self.size
+        self.frame_timer = frame_timer
+        self._event = None
+        with self.canvas.before:
+            Color(0, 0, 0, 0.6)
+            self._bg = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._update_bg)
+
+    def _update_bg(self, instance, value):
+        self._bg.pos = self.pos
+
+    def show(self):
+        if self.parent is None:
+            Window.add_widget(self)
+            self.pos = (0, Window.height - self.height)
+        self.refresh()
+        self._event = self._event or Clock.schedule_interval(self.refresh, 0.5)
+
+    def hide(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        if self.parent is not None:
+            Window.remove_widget(self)
+
+    def refresh(self, *args):
+        lines = [self.frame_timer.report()]
+        interaction = ui_trace.last_finished()
+        if interaction is not None:
+            phases = ", ".join(f"{phase} {seconds * 1000:.0f}" for phase, seconds in interaction.phase_totals().items())
+            lines.append(f"{interaction.name}: {interaction.duration() * 1000:.0f} ms ({phases})")
+        self.text = "\n".join(lines)
 
 # --- Firebase Initialization ---
-try:
-    if not firebase_admin._apps:
-        cred = credentials.Certificate(SERVICE_ACCOUNT_KEY_PATH)
-        firebase_admin.initialize_app(cred)
-    db = firestore.client()
-    print("Firebase Initialized Successfully.")
-    FIREBASE_INITIALIZED = True
-except FileNotFoundError:
-    print(f"Error: Service account key file not found at {SERVICE_ACCOUNT_KEY_PATH}")
-    db = None
-    FIREBASE_INITIALIZED = False
-except Exception as e:
-    print(f"Error initializing Firebase: {e}")
-    db = None
-    FIREBASE_INITIALIZED = False
+# The SDK is only imported, and the client created, by init_firebase() on a
+# background thread once the first frame is up; until then views are served
+# from the local cache and writes wait in the write queue.
+firestore = None
+google_exceptions = None
+db = None
+FIREBASE_INITIALIZED = False
+firebase_ready = threading.Event()  # Set when init_firebase() finished, whether it succeeded or not
+
+def init_firebase():
+    """Imports the Firebase SDK and creates the Firestore client (blocking; run it off the main thread)."""
+    global firestore, google_exceptions, db, FIREBASE_INITIALIZED
+    try:
+        import firebase_admin
+        from firebase_admin import credentials, firestore as firestore_module
+        from google.api_core import exceptions as google_exceptions_module
+        firestore, google_exceptions = firestore_module, google_exceptions_module
+        startup_timer.mark('firebase_import')
+        if not firebase_admin._apps:
+            cred = credentials.Certificate(SERVICE_ACCOUNT_KEY_PATH)
+            firebase_admin.initialize_app(cred)
+        db = firestore.client()
+        print("Firebase Initialized Successfully.")
+        FIREBASE_INITIALIZED = True
+    except FileNotFoundError:
+        print(f"Error: Service account key file not found at {SERVICE_ACCOUNT_KEY_PATH}")
+        db = None
+        FIREBASE_INITIALIZED = False
+    except Exception as e:
+        print(f"Error initializing Firebase: {e}")
+        db = None
+        FIREBASE_INITIALIZED = False
+    finally:
+        firebase_ready.set()
+
+def wait_for_firebase(timeout=None):
+    """Blocks until initialization finished; returns whether Firestore can be used."""
+    firebase_ready.wait(timeout)
+    return FIREBASE_INITIALIZED and db is not None
 
 # --- Custom Input Filter Functions ---
+# Called by TextInput on every keystroke and paste, and by the bulk import
+# for every row, so the patterns are compiled once and each filter makes a
+# single pass that stops as soon as the result is known. Text that already
+# passes is returned as is.
+NOT_LETTER_OR_SPACE = re.compile(r'[^A-Za-z\s]')
+DATE_CHARS = re.compile(r'[0-9\-]+')
+ODD_CHARS = re.compile(r'[0-9.]+')
+DATE_LENGTH = 10
+ODD_DIGITS = 4
+
 def letters_and_space(text, from_undo):
     """Allow only letters and spaces."""
-    return re.sub(r'[^A-Za-z\s]', '', text)
+    return NOT_LETTER_OR_SPACE.sub('', text)
+
+def _leading_chars(pattern, text, count):
+    """Returns the first `count` characters of `text` matched by `pattern`, reading no further."""
+    match = pattern.match(text)
+    if match is not None and match.end() == len(text):  # Nothing to drop (a typed character)
+        return text[:count]
+    kept = ''
+    for match in pattern.finditer(text):
+        kept += match.group()
+        if len(kept) >= count:
+            return kept[:count]
+    return kept
 
 def date_filter(text, from_undo):
     """Allow only digits and hyphens (for a format like YYYY-MM-DD)."""
-    text = re.sub(r'[^0-9\-]', '', text)
-    return text[:10]
+    return _leading_chars(DATE_CHARS, text, DATE_LENGTH)
 
 def odd_filter(text, from_undo):
     """Allow only numbers and one decimal point, max 4 digits total."""
     if not text:
         return ''
-    # Remove any non-digit and non-decimal characters
-    filtered = re.sub(r'[^0-9\.]', '', text)
-    # Ensure only one decimal point
-    parts = filtered.split('.')
-    if len(parts) > 2:
-        filtered = parts[0] + '.' + parts[1]
-    # Limit total length to 4 characters (excluding decimal point)
-    digits = filtered.replace('.', '')
-    if len(digits) > 4:
-        if '.' in filtered:
-            dec_pos = filtered.index('.')
-            filtered = filtered[:dec_pos + (5-dec_pos)]
-        else:
-            filtered = filtered[:4]
-    return filtered
+    # The result never has more than 4 digits and a point, so 6 characters decide it
+    kept = _leading_chars(ODD_CHARS, text, ODD_DIGITS + 2)
+    point = kept.find('.')
+    if point != -1:
+        # Anything from a second decimal point on is dropped
+        second_point = kept.find('.', point + 1)
+        if second_point != -1:
+            kept = kept[:second_point]
+    digits = len(kept) - (point != -1)
+    if digits > ODD_DIGITS:
+        # Keeps 5 characters when there is a point anywhere (even past the ones read), else 4 digits
+        return kept[:ODD_DIGITS + 1] if point != -1 or '.' in text else kept[:ODD_DIGITS]
+    return kept
 
 # --- Helper Function for Rounded Borders ---
 def add_rounded_background(widget, bg_color, radius_dp=15):
@@ -87,17 +379,2089 @@ def add_rounded_background(widget, bg_color, radius_dp=15):
 
     widget.bind(pos=update_rect, size=update_rect)
 
+# --- Profit & Per-User Stats ---
+STATUS_COUNTERS = {'Pending': 'pending', 'Win': 'win', 'Loose': 'loose'}
+STATS_FIELDS = ('tips', 'staked', 'settled_staked', 'profit', 'pending', 'win', 'loose')
+
+def tip_profit(value, odd, status):
+    """Profit of a single tip: a win pays value * odd - value, a loss costs the stake."""
+    if status == 'Win':
+        return value * odd - value
+    if status == 'Loose':
+        return -value
+    return 0.0
+
+def tip_stats(tip):
+    """Returns the contribution of one Tip to its user's aggregates."""
+    value = tip.value or 0.0
+    stats = dict.fromkeys(STATS_FIELDS, 0)
+    stats['tips'] = 1
+    stats['staked'] = value
+    if tip.status in ('Win', 'Loose'):
+        stats['settled_staked'] = value
+    stats['profit'] = tip.profit
+    stats[STATUS_COUNTERS[tip.status]] = 1
+    return stats
+
+def sum_tip_stats(tips):
+    """Returns the aggregates of all of a user's Tips, marked `complete`."""
+    stats = dict.fromkeys(STATS_FIELDS, 0)
+    for tip in tips:
+        for field, value in tip_stats(tip).items():
+            stats[field] += value
+    stats['complete'] = True
+    return stats
+
+def stats_delta(old_tip, new_tip):
+    """Returns the per-field change of a user's aggregates when `old_tip` becomes `new_tip`.
+
+    Either side may be None (insertion / deletion).
+    """
+    old_stats = tip_stats(old_tip) if old_tip else dict.fromkeys(STATS_FIELDS, 0)
+    new_stats = tip_stats(new_tip) if new_tip else dict.fromkeys(STATS_FIELDS, 0)
+    return {field: new_stats[field] - old_stats[field] for field in STATS_FIELDS}
+
+def win_rate(stats):
+    """Share of settled tips that won, or None when nothing is settled yet."""
+    settled = stats.get('win', 0) + stats.get('loose', 0)
+    return stats.get('win', 0) / settled if settled else None
+
+# --- Tip Model ---
+def to_epoch(value):
+    """Converts a Firestore timestamp (or datetime) to epoch seconds; other values pass through."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+def epoch_to_datetime(seconds):
+    """Converts epoch seconds back to a timezone-aware datetime usable in Firestore queries."""
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _to_text(value):
+    return None if value is None else str(value)
+
+class Tip:
+    """One tip, parsed and validated once when it enters the app.
+
+    Firestore documents and cache rows are turned into Tips at the boundary;
+    the table, the stats and the cache all read these attributes instead of
+    re-parsing dicts on every redraw. `profit` is precomputed.
+    Missing text fields are None, `value`/`odd` are floats (None if missing or
+    invalid), `status` is always one of STATUS_COUNTERS and the timestamps
+    are epoch seconds. `previous_status` and `settled_at` are set by the
+    backend on every status change (settled_at is None while pending).
+    """
+    __slots__ = ('id', 'user', 'team1', 'team2', 'competition', 'bet', 'sport', 'date',
+                 'value', 'odd', 'live', 'status', 'inserted_at', 'updated_at',
+                 'previous_status', 'settled_at', 'profit')
+    FIELDS = __slots__[1:-1]  # The document fields, in storage order
+
+    def __init__(self, tip_id, user=None, team1=None, team2=None, competition=None, bet=None, sport=None,
+                 date=None, value=None, odd=None, live=False, status='Pending', inserted_at=None, updated_at=None,
+                 previous_status=None, settled_at=None):
+        self.id = tip_id
+        self.user = user
+        self.team1 = team1
+        self.team2 = team2
+        self.competition = competition
+        self.bet = bet
+        self.sport = sport
+        self.date = date
+        self.value = value
+        self.odd = odd
+        self.live = live
+        self.status = status
+        self.inserted_at = inserted_at
+        self.updated_at = updated_at
+        self.previous_status = previous_status
+        self.settled_at = settled_at
+        self.profit = tip_profit(value or 0.0, odd or 0.0, status)
+
+    @classmethod
+    def from_dict(cls, tip_id, data):
+        """Parses a Firestore document (or form/queue dict) into a Tip."""
+        status = data.get('status', 'Pending')
+        previous_status = data.get('previous_status')
+        return cls(
+            tip_id,
+            user=_to_text(data.get('user')),
+            team1=_to_text(data.get('team1')),
+            team2=_to_text(data.get('team2')),
+            competition=_to_text(data.get('competition')),
+            bet=_to_text(data.get('bet')),
+            sport=_to_text(data.get('sport')),
+            date=_to_text(data.get('date')),
+            value=_to_float(data.get('value')),
+            odd=_to_float(data.get('odd')),
+            live=bool(data.get('live', False)),
+            status=status if status in STATUS_COUNTERS else 'Pending',
+            inserted_at=to_epoch(data.get('inserted_at')),
+            updated_at=to_epoch(data.get('updated_at')),
+            previous_status=previous_status if previous_status in STATUS_COUNTERS else None,
+            settled_at=to_epoch(data.get('settled_at')),
+        )
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @property
+    def page_key(self):
+        """`(inserted_at, id)`: the unique key tips are ordered and paged by, newest first."""
+        return (self.inserted_at, self.id)
+
+    def replace(self, **changes):
+        """Returns a copy with some fields changed (profit is recomputed)."""
+        return Tip(self.id, **dict(self.to_dict(), **changes))
+
+    def __repr__(self):
+        return f"Tip({self.id!r}, user={self.user!r}, status={self.status!r})"
+
+# --- Local Tips Cache ---
+class TipsCache:
+    """On-disk SQLite copy of the `tips` collection.
+
+    Tips are stored one column per Tip field, keyed by document id, with
+    indexes on `(inserted_at, id)` and `user` so views can be served without
+    the network. All methods are safe to call from background threads.
+    """
+    TIP_COLUMNS = ', '.join(Tip.FIELDS)
+    SCHEMA_VERSION = 3
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+                # Older caches have other columns (or a JSON blob per tip) and page by `inserted_at` alone;
+                # it is only a copy, so start over
+                self._conn.executescript("""
+                    DROP TABLE IF EXISTS tips;
+                    DROP TABLE IF EXISTS meta;
+                """)
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tips (
+                    id TEXT PRIMARY KEY,
+                    user TEXT,
+                    team1 TEXT,
+                    team2 TEXT,
+                    competition TEXT,
+                    bet TEXT,
+                    sport TEXT,
+                    date TEXT,
+                    value REAL,
+                    odd REAL,
+                    live INTEGER,
+                    status TEXT,
+                    inserted_at REAL,
+                    updated_at REAL,
+                    previous_status TEXT,
+                    settled_at REAL,
+                    pending INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS tips_by_inserted_at_id ON tips (inserted_at, id);
+                CREATE INDEX IF NOT EXISTS tips_by_user_inserted_at_id ON tips (user, inserted_at, id);
+                CREATE INDEX IF NOT EXISTS tips_by_updated_at ON tips (updated_at);
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS user_stats (
+                    user TEXT PRIMARY KEY,
+                    data TEXT NOT NULL
+                );
+            """)
+
+    def load_tips(self, user_filter=None, before=None, limit=None):
+        """Returns cached tips newest first, optionally for one user and/or after the `before` cursor.
+
+        Tips are ordered by `(inserted_at, id)`, so tips sharing a timestamp
+        (a bulk import) have a fixed order too; `before` is the
+        `(inserted_at, id)` of the last tip already shown.
+        """
+        sql = f"SELECT id, {self.TIP_COLUMNS} FROM tips WHERE inserted_at IS NOT NULL"
+        params = []
+        if user_filter:
+            sql += " AND user = ?"
+            params.append(user_filter)
+        if before is not None:
+            sql += " AND (inserted_at, id) < (?, ?)"
+            params.extend(before)
+        sql += " ORDER BY inserted_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        # Rows were validated when stored, so they map straight onto Tip
+        return [Tip(*row) for row in rows]
+
+    def load_tips_since(self, since, column='inserted_at'):
+        """Returns the tips whose `column` ('inserted_at' or 'updated_at') is after `since`, oldest first."""
+        if column not in ('inserted_at', 'updated_at'):
+            raise ValueError(f"Cannot query tips by {column}")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, {self.TIP_COLUMNS} FROM tips WHERE {column} > ? ORDER BY {column}", (since,)
+            ).fetchall()
+        return [Tip(*row) for row in rows]
+
+    def load_tips_by_id(self, after_id, limit):
+        """Returns up to `limit` tips whose id sorts after `after_id`, in id order."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, {self.TIP_COLUMNS} FROM tips WHERE id > ? ORDER BY id LIMIT ?", (after_id, limit)
+            ).fetchall()
+        return [Tip(*row) for row in rows]
+
+    def upsert_tips(self, tips, pending=False):
+        """Inserts or replaces the given Tips.
+
+        `pending` marks local tips that have not reached Firestore yet; their
+        provisional `inserted_at` is ignored when looking for the sync point.
+        """
+        rows = [(tip.id,) + tuple(getattr(tip, field) for field in Tip.FIELDS) + (int(pending),) for tip in tips]
+        if not rows:
+            return
+        placeholders = ', '.join('?' * (len(Tip.FIELDS) + 2))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO tips (id, {self.TIP_COLUMNS}, pending) VALUES ({placeholders})",
+                rows
+            )
+
+    def get_tip(self, tip_id):
+        """Returns the cached Tip with the given id, or None."""
+        with self._lock:
+            row = self._conn.execute(f"SELECT id, {self.TIP_COLUMNS} FROM tips WHERE id = ?", (tip_id,)).fetchone()
+        return Tip(*row) if row else None
+
+    def is_pending(self, tip_id):
+        with self._lock:
+            row = self._conn.execute("SELECT pending FROM tips WHERE id = ?", (tip_id,)).fetchone()
+        return bool(row and row[0])
+
+    def delete_tips(self, tip_ids):
+        """Removes the given tip ids from the cache."""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM tips WHERE id = ?", [(tip_id,) for tip_id in tip_ids])
+
+    def newest_inserted_at(self):
+        """Returns the newest cached `inserted_at` (epoch seconds), or None for an empty cache."""
+        with self._lock:
+            return self._conn.execute("SELECT MAX(inserted_at) FROM tips WHERE pending = 0").fetchone()[0]
+
+    def load_columns(self):
+        """Returns all cached tips as rows of (user, sport, competition, odd, value, status, date).
+
+        The columns already hold the values Tip parsed, so only the status
+        is mapped to 0 (pending) / 1 (win) / 2 (loose) and the date to a
+        valid YYYY-MM-DD string or NULL.
+        """
+        with self._lock:
+            return self._conn.execute("""
+                SELECT COALESCE(user, ''), COALESCE(sport, ''), COALESCE(competition, ''), odd, value,
+                       CASE status WHEN 'Win' THEN 1 WHEN 'Loose' THEN 2 ELSE 0 END,
+                       date(date)
+                FROM tips
+            """).fetchall()
+
+    def get_user_stats(self, user):
+        """Returns the mirrored `user_stats` document of a user, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM user_stats WHERE user = ?", (user,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def all_user_stats(self):
+        """Returns every mirrored `user_stats` document as {user: stats}."""
+        with self._lock:
+            rows = self._conn.execute("SELECT user, data FROM user_stats").fetchall()
+        return {user: json.loads(data) for user, data in rows}
+
+    def set_user_stats(self, user, stats):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO user_stats (user, data) VALUES (?, ?)", (user, json.dumps(stats)))
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_meta(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+# --- Data Access ---
+FIRESTORE_WORKERS = 4
+
+class DataAccess:
+    """Runs Firestore reads on a bounded thread pool and hands results back on the Kivy main thread.
+
+    Requests are keyed: asking for a key that is already in flight joins the
+    running request instead of starting another one. Every request belongs to
+    the view that was current when it was made; `new_view()` cancels requests
+    that have not started yet and makes sure late results of older views are
+    never delivered.
+    """
+
+    def __init__(self, max_workers=FIRESTORE_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='firestore')
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.generation = 0
+
+    def new_view(self):
+        """Marks the start of a new view; everything requested before it becomes stale."""
+        self.generation += 1
+        with self._lock:
+            stale = list(self._in_flight.values())
+        for future in stale:
+            future.cancel()  # Only succeeds for requests still waiting for a worker
+
+    def request(self, key, fn, *args, on_result=None):
+        """Runs `fn(*args)` in the pool (or joins the identical request in flight).
+
+        `on_result(result, error)` is called on the main thread, unless the
+        view changed in the meantime. Returns the Future.
+        """
+        started = False
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None or future.cancelled():
+                future = self._executor.submit(fn, *args)
+                self._in_flight[key] = future
+                started = True
+        if started:
+            # Outside the lock: a request that already finished runs the callback right here
+            future.add_done_callback(lambda f, key=key: self._forget(key, f))
+        if on_result is not None:
+            generation = self.generation
+            future.add_done_callback(
+                lambda f: Clock.schedule_once(lambda dt: self._deliver(f, generation, on_result), 0)
+            )
+        return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def _deliver(self, future, generation, on_result):
+        if generation != self.generation or future.cancelled():
+            return
+        error = future.exception()
+        on_result(None if error else future.result(), error)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# --- Storage Backends ---
+def ops_user_deltas(ops):
+    """Returns {user: per-field change} of the aggregates for a batch of write queue ops."""
+    user_deltas = {}
+    for op in ops:
+        if op['op'] == 'insert':
+            new_tip = Tip.from_dict(op['id'], op['data'])
+            user, delta = new_tip.user, stats_delta(None, new_tip)
+        else:
+            old_tip = Tip.from_dict(op['id'], {'value': op.get('value'), 'odd': op.get('odd'),
+                                               'status': op.get('previous_status')})
+            user, delta = op.get('user'), stats_delta(old_tip, old_tip.replace(status=op['status']))
+        if user:
+            totals = user_deltas.setdefault(user, dict.fromkeys(STATS_FIELDS, 0))
+            for field, change in delta.items():
+                totals[field] += change
+    return user_deltas
+
+class StatusConflict(Exception):
+    """A status update was rejected because the tip's stored status is not the one it was based on.
+
+    `tip` is the tip as stored (e.g. settled differently on another device).
+    """
+
+    def __init__(self, tip):
+        super().__init__(f"Tip {tip.id} is already {tip.status}")
+        self.tip = tip
+
+def status_op_pending(op, current):
+    """Whether a status op still has to be applied to the stored Tip `current`.
+
+    The op applies only while the stored status is still the one the update
+    was based on. If the op itself was already applied (a retried commit
+    that had gone through) it is skipped; any other state raises StatusConflict.
+    """
+    expected = op.get('previous_status') or 'Pending'
+    if current.status == expected:
+        return True
+    if current.status == op['status'] and current.previous_status == expected:
+        return False
+    raise StatusConflict(current)
+
+class TipsRepository(ABC):
+    """Where tips and the per-user aggregates are stored.
+
+    MainApp, the write queue and the listener only go through a repository,
+    so Firestore can be replaced by LocalTipsRepository for load tests and
+    benchmarks. Tips come back as Tip objects and timestamps are epoch
+    seconds. Methods other than start() block and belong on a worker thread.
+    """
+    starting = False  # True while the backend is still connecting
+
+    def start(self, on_ready):
+        """Connects in the background; `on_ready()` is called (on any thread) once done."""
+        on_ready()
+
+    def wait_ready(self, timeout=None):
+        """Waits for start() to finish; returns whether the backend can be used."""
+        return True
+
+    @abstractmethod
+    def fetch_page(self, user, before, limit):
+        """Returns up to `limit` tips (of `user`, if given) after the `before` cursor (if given), newest first.
+
+        Tips are ordered by `Tip.page_key`, `(inserted_at, id)`, and `before`
+        is the page_key of the last tip already shown: tips inserted together
+        share a timestamp, so the id is needed to resume between them.
+        """
+
+    @abstractmethod
+    def fetch_inserted_after(self, since):
+        """Returns the tips inserted after `since`, oldest first."""
+
+    @abstractmethod
+    def fetch_updated_after(self, since):
+        """Returns the tips updated after `since`."""
+
+    @abstractmethod
+    def iter_tip_pages(self, page_size):
+        """Yields every tip as lists of up to `page_size`, in document id order, one page in memory at a time."""
+
+    @abstractmethod
+    def get_user_stats(self, user):
+        """Returns the `user_stats` aggregates of `user` as a dict, or None if there are none yet."""
+
+    @abstractmethod
+    def rebuild_user_stats(self, user):
+        """Recomputes the aggregates of `user` from all their tips, unless already `complete`; returns them.
+
+        The aggregates are re-read, the tips summed and the result written
+        atomically, so a commit incrementing them meanwhile is not lost and
+        aggregates completed by another client are kept as they are.
+        """
+
+    @abstractmethod
+    def commit(self, ops):
+        """Applies write queue ops atomically, adjusting the users' aggregates in the same write.
+
+        Inserts and updates get `inserted_at`/`updated_at` from the backend's
+        clock; a status change records `previous_status` and `settled_at`
+        (None when back to pending). A status op only applies if the tip is
+        still in the op's `previous_status` (see status_op_pending), otherwise
+        nothing is written and StatusConflict is raised. Ops that were already
+        applied are skipped, so a retried commit never counts twice.
+        """
+
+    def is_permanent_error(self, error):
+        """Whether retrying a commit that raised `error` cannot succeed."""
+        return False
+
+    def is_not_found(self, error):
+        return False
+
+    @abstractmethod
+    def watch(self, since, on_tips, on_stats):
+        """Reports changes until the returned function is called.
+
+        `on_tips(diffs)` gets the tips updated after `since` first, then every
+        later change, as (change_type, Tip) tuples; `on_stats({user: stats})`
+        gets the aggregates the same way. Both run on a backend thread.
+        """
+
+class FirestoreTipsRepository(TipsRepository):
+    """The `tips` and `user_stats` Firestore collections."""
+
+    @property
+    def starting(self):
+        return not firebase_ready.is_set()
+
+    def start(self, on_ready):
+        def run():
+            init_firebase()
+            on_ready()
+        threading.Thread(target=run, daemon=True).start()
+
+    def wait_ready(self, timeout=None):
+        return wait_for_firebase(timeout)
+
+    @staticmethod
+    def _tips(query):
+        return [Tip.from_dict(doc.id, doc.to_dict()) for doc in query.stream()]
+
+    def fetch_page(self, user, before, limit):
+        query = db.collection('tips')
+        if user:
+            # When filtering by user, order by inserted_at after the filter
+            query = query.where('user', '==', user)
+        query = (query.order_by('inserted_at', direction=firestore.Query.DESCENDING)
+                 .order_by('__name__', direction=firestore.Query.DESCENDING))
+        if before is not None:
+            inserted_at, tip_id = before
+            query = query.start_after({'inserted_at': epoch_to_datetime(inserted_at),
+                                       '__name__': db.collection('tips').document(tip_id)})
+        return self._tips(query.limit(limit))
+
+    def fetch_inserted_after(self, since):
+        return self._tips(db.collection('tips')
+                          .where('inserted_at', '>', epoch_to_datetime(since))
+                          .order_by('inserted_at'))
+
+    def fetch_updated_after(self, since):
+        return self._tips(db.collection('tips').where('updated_at', '>', epoch_to_datetime(since)))
+
+    def iter_tip_pages(self, page_size):
+        # Paged by document id: unlike inserted_at it is unique, so no tip is skipped
+        query = db.collection('tips').order_by('__name__').limit(page_size)
+        last_doc = None
+        while True:
+            docs = list((query if last_doc is None else query.start_after(last_doc)).stream())
+            if docs:
+                yield [Tip.from_dict(doc.id, doc.to_dict()) for doc in docs]
+            if len(docs) < page_size:
+                return
+            last_doc = docs[-1]
+
+    def get_user_stats(self, user):
+        snapshot = db.collection('user_stats').document(user).get()
+        return snapshot.to_dict() if snapshot.exists else None
+
+    def rebuild_user_stats(self, user):
+        stats_ref = db.collection('user_stats').document(user)
+        tips_query = db.collection('tips').where('user', '==', user).select(['value', 'odd', 'status'])
+
+        @firestore.transactional
+        def rebuild(transaction):
+            # Both reads are preconditions: a commit changing the tips or the aggregates retries the rebuild
+            snapshot = stats_ref.get(transaction=transaction)
+            stats = snapshot.to_dict() if snapshot.exists else None
+            if stats and stats.get('complete'):
+                return stats
+            stats = sum_tip_stats(Tip.from_dict(doc.id, doc.to_dict()) for doc in transaction.get(tips_query))
+            transaction.set(stats_ref, stats)
+            return stats
+
+        return rebuild(db.transaction())
+
+    def commit(self, ops):
+        tips = db.collection('tips')
+        refs = [tips.document(op['id']) for op in ops]
+
+        @firestore.transactional
+        def write(transaction):
+            # All reads come first: they are the preconditions of the writes
+            snapshots = {snapshot.id: snapshot for snapshot in db.get_all(refs, transaction=transaction)}
+            applied = []
+            for op, tip_ref in zip(ops, refs):
+                snapshot = snapshots.get(op['id'])
+                exists = snapshot is not None and snapshot.exists
+                if op['op'] == 'insert':
+                    if exists:
+                        continue  # Written by an earlier attempt of this commit
+                    data = dict(op['data'], inserted_at=firestore.SERVER_TIMESTAMP,
+                                updated_at=firestore.SERVER_TIMESTAMP)
+                    if data.get('status', 'Pending') != 'Pending':
+                        data['settled_at'] = firestore.SERVER_TIMESTAMP
+                    transaction.set(tip_ref, data)
+                else:
+                    if not exists:
+                        raise google_exceptions.NotFound(f"Tip {op['id']} not found")
+                    current = Tip.from_dict(snapshot.id, snapshot.to_dict())
+                    if not status_op_pending(op, current):
+                        continue
+                    transaction.update(tip_ref, {
+                        'status': op['status'],
+                        'previous_status': current.status,
+                        'settled_at': firestore.SERVER_TIMESTAMP if op['status'] != 'Pending' else None,
+                        'updated_at': firestore.SERVER_TIMESTAMP,
+                    })
+                applied.append(op)
+
+            # Aggregates move in the same transaction as the tips, so they never drift apart
+            for user, totals in ops_user_deltas(applied).items():
+                increments = {field: firestore.Increment(change) for field, change in totals.items() if change}
+                if increments:
+                    transaction.set(db.collection('user_stats').document(user), increments, merge=True)
+
+        write(db.transaction())
+
+    def is_permanent_error(self, error):
+        return isinstance(error, (
+            StatusConflict,
+            google_exceptions.NotFound,
+            google_exceptions.InvalidArgument,
+            google_exceptions.PermissionDenied,
+            google_exceptions.FailedPrecondition,
+        ))
+
+    def is_not_found(self, error):
+        return isinstance(error, google_exceptions.NotFound)
+
+    def watch(self, since, on_tips, on_stats):
+        def on_tips_snapshot(doc_snapshots, changes, read_time):
+            on_tips([(change.type.name, Tip.from_dict(change.document.id, change.document.to_dict() or {}))
+                     for change in changes])
+
+        def on_stats_snapshot(doc_snapshots, changes, read_time):
+            on_stats({change.document.id: change.document.to_dict() or {}
+                      for change in changes if change.type.name != 'REMOVED'})
+
+        tips_watch = (db.collection('tips')
+                      .where('updated_at', '>', epoch_to_datetime(since))
+                      .on_snapshot(on_tips_snapshot))
+        stats_watch = db.collection('user_stats').on_snapshot(on_stats_snapshot)
+
+        def unsubscribe():
+            tips_watch.unsubscribe()
+            stats_watch.unsubscribe()
+        return unsubscribe
+
+class TipNotFound(LookupError):
+    """Raised by LocalTipsRepository for a status update of a tip it does not have."""
+
+class LocalTipsRepository(TipsRepository):
+    """In-process stand-in for Firestore, stored in SQLite (in memory by default).
+
+    It answers the same queries the app sends to Firestore (equality on
+    `user`, order and cursor on `(inserted_at, id)`, `limit`, `updated_at`
+    ranges), stamps all writes of a commit with one timestamp (like
+    SERVER_TIMESTAMP in a Firestore transaction; commits get strictly
+    increasing ones) and delivers changes to watchers synchronously on commit.
+    Select it in the app with TIPS_BACKEND=local; benchmark.py uses it.
+    """
+
+    def __init__(self, path=':memory:'):
+        self._store = TipsCache(path)
+        self._lock = threading.Lock()
+        self._watchers = []
+        self._last_timestamp = 0.0
+
+    def _now(self):
+        self._last_timestamp = max(time.time(), self._last_timestamp + 1e-6)
+        return self._last_timestamp
+
+    def fetch_page(self, user, before, limit):
+        return self._store.load_tips(user, before=before, limit=limit)
+
+    def fetch_inserted_after(self, since):
+        return self._store.load_tips_since(since, 'inserted_at')
+
+    def fetch_updated_after(self, since):
+        return self._store.load_tips_since(since, 'updated_at')
+
+    def iter_tip_pages(self, page_size):
+        after_id = ''
+        while True:
+            page = self._store.load_tips_by_id(after_id, page_size)
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+
+    def get_user_stats(self, user):
+        return self._store.get_user_stats(user)
+
+    def rebuild_user_stats(self, user):
+        with self._lock:
+            stats = self._store.get_user_stats(user)
+            if stats and stats.get('complete'):
+                return stats
+            stats = sum_tip_stats(self._store.load_tips(user))
+            self._store.set_user_stats(user, stats)
+            watchers = list(self._watchers)
+        for on_tips, on_stats in watchers:
+            on_stats({user: stats})
+        return stats
+
+    def commit(self, ops):
+        with self._lock:
+            written = {}
+            applied = []
+            now = self._now()
+            for op in ops:
+                if op['op'] == 'insert':
+                    if op['id'] in written or self._store.get_tip(op['id']):
+                        continue  # Already written
+                    tip = Tip.from_dict(op['id'], dict(op['data'], inserted_at=now, updated_at=now))
+                    written[op['id']] = ('ADDED', tip.replace(settled_at=now) if tip.status != 'Pending' else tip)
+                    applied.append(op)
+                    continue
+                kind, tip = written.get(op['id']) or ('MODIFIED', self._store.get_tip(op['id']))
+                if tip is None:
+                    raise TipNotFound(op['id'])  # Before anything is written, like a failed batch
+                # Raises StatusConflict before anything is written, too
+                if not status_op_pending(op, tip):
+                    continue
+                written[op['id']] = (kind, tip.replace(
+                    status=op['status'], previous_status=tip.status, updated_at=now,
+                    settled_at=now if op['status'] != 'Pending' else None,
+                ))
+                applied.append(op)
+            self._store.upsert_tips([tip for kind, tip in written.values()])
+
+            # Same merge as Firestore's Increment: other fields (e.g. `complete`) are kept
+            stats = {}
+            for user, totals in ops_user_deltas(applied).items():
+                merged = self._store.get_user_stats(user) or {}
+                for field, change in totals.items():
+                    if change:
+                        merged[field] = merged.get(field, 0) + change
+                self._store.set_user_stats(user, merged)
+                stats[user] = merged
+            watchers = list(self._watchers)
+        for on_tips, on_stats in watchers:
+            if written:
+                on_tips(list(written.values()))
+            if stats:
+                on_stats(stats)
+
+    def is_permanent_error(self, error):
+        return isinstance(error, (TipNotFound, StatusConflict))
+
+    def is_not_found(self, error):
+        return isinstance(error, TipNotFound)
+
+    def watch(self, since, on_tips, on_stats):
+        watcher = (on_tips, on_stats)
+        with self._lock:
+            self._watchers.append(watcher)
+            initial_tips = self._store.load_tips_since(since, 'updated_at')
+            initial_stats = self._store.all_user_stats()
+        if initial_tips:
+            on_tips([('ADDED', tip) for tip in initial_tips])
+        if initial_stats:
+            on_stats(initial_stats)
+
+        def unsubscribe():
+            with self._lock:
+                self._watchers.remove(watcher)
+        return unsubscribe
+
+# --- Write-Behind Queue ---
+MAX_BATCH_WRITES = 500  # Firestore limit per WriteBatch or transaction
+MAX_RETRY_DELAY = 60
+def new_document_id():
+    """Generates a Firestore-style auto id, so queued inserts know their id before they are written."""
+    alphabet = string.ascii_letters + string.digits
+    return ''.join(random.SystemRandom().choice(alphabet) for _ in range(20))
+
+class WriteQueue:
+    """Persistent write-behind queue flushed to Firestore by a single worker thread.
+
+    Pending inserts and status updates are coalesced (a status update on a tip
+    that is still queued for insertion is folded into the insert, repeated
+    status updates keep only the last one) and committed in chunks of up to
+    MAX_BATCH_WRITES (one Firestore transaction each).
+    The queue is saved to `path` on every change, so writes made offline
+    survive restarts; failed commits are retried with exponential backoff.
+    Batches are committed through `repository` (a TipsRepository).
+
+    `on_committed(ops)` and `on_failed(op, error)` are called on the worker
+    thread after a batch is written or a write is dropped.
+    """
+
+    def __init__(self, path, repository, on_committed=None, on_failed=None):
+        self.path = path
+        self.repository = repository
+        self.on_committed = on_committed
+        self.on_failed = on_failed
+        self._cond = threading.Condition()
+        self._pending = self._load()
+        self._in_flight = []
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except ValueError as e:
+            print(f"Ignoring unreadable write queue {self.path}: {e}")
+            return []
+
+    def _save(self):
+        # Called with the lock held; write to a temp file so a crash never leaves half a queue
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._in_flight + self._pending, f)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        with self._cond:
+            return len(self._in_flight) + len(self._pending)
+
+    def enqueue_insert(self, tip_data):
+        """Queues a new tip and returns the document id it will be written under."""
+        tip_id = new_document_id()
+        with self._cond:
+            self._pending.append({'op': 'insert', 'id': tip_id, 'data': tip_data})
+            self._save()
+            self._cond.notify()
+        return tip_id
+
+    def enqueue_status(self, tip_id, status, tip=None):
+        """Queues a status update, coalescing it with writes for the same tip still waiting.
+
+        `tip` is the Tip as currently known; its user, value, odd and status
+        are kept with the write so the user's aggregates can be adjusted in
+        the same batch.
+        """
+        tip = tip or Tip(tip_id)
+        with self._cond:
+            for op in self._pending:
+                if op['id'] != tip_id:
+                    continue
+                if op['op'] == 'insert':
+                    op['data']['status'] = status
+                    break
+                if op['op'] == 'status':
+                    op['status'] = status  # previous_status stays the one before the first update
+                    break
+            else:
+                self._pending.append({
+                    'op': 'status', 'id': tip_id, 'status': status,
+                    'user': tip.user, 'value': tip.value, 'odd': tip.odd, 'previous_status': tip.status,
+                })
+            self._save()
+            self._cond.notify()
+
+    def _run(self):
+        delay = 1
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                self._in_flight = self._pending[:MAX_BATCH_WRITES]
+                del self._pending[:MAX_BATCH_WRITES]
+                ops = self._in_flight
+            try:
+                self._commit_ops(ops)
+            except Exception as e:
+                print(f"Write queue: commit of {len(ops)} writes failed, retrying in {delay}s: {e}")
+                with self._cond:
+                    # Put the writes back in front of anything queued meanwhile
+                    self._pending[:0] = self._in_flight
+                    self._in_flight = []
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                continue
+            delay = 1
+            with self._cond:
+                self._in_flight = []
+                self._save()
+
+    def _commit_ops(self, ops):
+        """Writes `ops` in one batch; a permanent error is narrowed down to the op causing it."""
+        if not self.repository.wait_ready():
+            raise RuntimeError("Storage backend not available")
+        try:
+            self.repository.commit(ops)
+        except Exception as e:
+            if not self.repository.is_permanent_error(e):
+                raise
+            if len(ops) == 1:
+                print(f"Write queue: dropping {ops[0]['op']} of tip {ops[0]['id']}: {e}")
+                if self.on_failed:
+                    self.on_failed(ops[0], e)
+                return
+            for op in ops:
+                self._commit_ops([op])
+            return
+        if self.on_committed:
+            self.on_committed(ops)
+
+# --- Bulk Import & Export ---
+# The insert form's input filters double as validation: a field is accepted
+# only if its filter would leave it unchanged.
+FIELD_FILTERS = {
+    'user': (letters_and_space, "may only contain letters and spaces"),
+    'team1': (letters_and_space, "may only contain letters and spaces"),
+    'team2': (letters_and_space, "may only contain letters and spaces"),
+    'competition': (letters_and_space, "may only contain letters and spaces"),
+    'sport': (letters_and_space, "may only contain letters and spaces"),
+    'date': (date_filter, "may only contain digits and hyphens"),
+    'odd': (odd_filter, "must be a number with at most 4 digits"),
+}
+REQUIRED_FIELDS = ('user', 'team1', 'team2', 'competition', 'bet', 'sport', 'date')
+EXPORT_FIELDS = ('id',) + Tip.FIELDS
+MAX_IMPORT_ERRORS = 20  # Invalid rows reported back; the rest are only counted
+
+def tip_data_from_input(fields):
+    """Validates a tip the way the insert form does and returns the document data to write.
+
+    `fields` holds the form's texts by field name; numbers and booleans (as
+    read from JSON) are accepted too. `status` defaults to 'Pending'.
+    Raises ValueError with a message for the user.
+    """
+    text = {field: str(value).strip() for field, value in fields.items()
+            if value is not None and not isinstance(value, bool)}
+    if not text.get('value'):
+        raise ValueError("Value cannot be empty")
+    if not text.get('odd'):
+        raise ValueError("Odd cannot be empty")
+    if not all(text.get(field) for field in REQUIRED_FIELDS):
+        raise ValueError("Please fill in all required fields (User, Team1, Team2, Competition, Bet, Sport, Date).")
+    for field, (input_filter, rule) in FIELD_FILTERS.items():
+        if input_filter(text[field], False) != text[field]:
+            raise ValueError(f"{field.capitalize()} {rule}.")
+    if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', text['date']):
+        raise ValueError("Date must be in YYYY-MM-DD format.")
+
+    live = fields.get('live', False)
+    if not isinstance(live, bool):
+        live = str(live).strip().lower() in ('yes', 'true', '1')
+    status = text.get('status') or 'Pending'
+    if status not in STATUS_COUNTERS:
+        raise ValueError(f"Unknown status {status!r}.")
+    return {
+        'user': text['user'],
+        'team1': text['team1'],
+        'team2': text['team2'],
+        'competition': text['competition'],
+        'value': float(text['value']),
+        'odd': float(text['odd']),
+        'bet': text['bet'],
+        'sport': text['sport'],
+        'date': text['date'],
+        'live': live,
+        'status': status,
+    }
+
+def tips_file_format(path):
+    """Returns 'csv', 'json' or 'jsonl' from the file extension."""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension == 'ndjson':
+        return 'jsonl'
+    if extension not in ('csv', 'json', 'jsonl'):
+        raise ValueError(f"Unsupported file type {path!r} (use .csv, .json or .jsonl)")
+    return extension
+
+def _iter_json_array(f, chunk_size=1 << 16):
+    """Yields the elements of a top-level JSON array without loading the whole file."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    started = False  # Past the opening '['
+    while True:
+        separators = ' \t\r\n,' if started else ' \t\r\n'
+        while pos < len(buffer) and buffer[pos] in separators:
+            pos += 1
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError("Expected a JSON array of tips")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # Objects, arrays and strings end with their closing character, but a number
+                # ('2' of '2.5') only ends at the delimiter after it, which may be in the next chunk
+                if eof or (end < len(buffer) and (buffer[pos] in '{["' or buffer[end] in ' \t\r\n,]')):
+                    yield item
+                    pos = end
+                    continue
+        if eof:
+            raise ValueError("Unexpected end of the JSON array")
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+def read_tip_rows(path):
+    """Yields (row number, fields) for each tip in a .csv, .json (array) or .jsonl file, streaming the file."""
+    file_format = tips_file_format(path)
+    with open(path, newline='' if file_format == 'csv' else None, encoding='utf-8') as f:
+        if file_format == 'csv':
+            yield from enumerate(csv.DictReader(f), start=1)
+        elif file_format == 'jsonl':
+            number = 0
+            for line in f:
+                if line.strip():
+                    number += 1
+                    yield number, json.loads(line)
+        else:
+            yield from enumerate(_iter_json_array(f), start=1)
+
+def import_tips(path, repository, on_progress=None, batch_size=MAX_BATCH_WRITES):
+    """Streams the tips of a file into the repository, `batch_size` inserts per commit.
+
+    Rows are validated with tip_data_from_input(); invalid rows are skipped.
+    Every tip gets a new id and the backend's `inserted_at`, and the users'
+    aggregates move with each batch. The tips of a batch share their
+    `inserted_at`; views page on `Tip.page_key`, which tells them apart. `on_progress(imported, skipped)` is
+    called after every batch. Returns (imported, skipped, errors) where
+    errors holds (row number, message) for the first invalid rows.
+    """
+    if not repository.wait_ready():
+        raise RuntimeError("Firebase not initialized.")
+    imported = skipped = 0
+    errors = []
+    batch = []
+
+    def flush():
+        nonlocal imported, batch
+        if batch:
+            repository.commit(batch)
+            imported += len(batch)
+            batch = []
+        if on_progress:
+            on_progress(imported, skipped)
+
+    for number, fields in read_tip_rows(path):
+        try:
+            if not isinstance(fields, dict):
+                raise ValueError("Expected an object with the tip fields")
+            data = tip_data_from_input(fields)
+        except ValueError as e:
+            skipped += 1
+            if len(errors) < MAX_IMPORT_ERRORS:
+                errors.append((number, str(e)))
+            continue
+        batch.append({'op': 'insert', 'id': new_document_id(), 'data': data})
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return imported, skipped, errors
+
+def export_tips(path, repository, on_progress=None, page_size=MAX_BATCH_WRITES):
+    """Writes every tip to a .csv, .json or .jsonl file, one page at a time.
+
+    The file is written next to `path` and moved into place when complete.
+    `on_progress(exported)` is called after every page. Returns the number of tips.
+    """
+    if not repository.wait_ready():
+        raise RuntimeError("Firebase not initialized.")
+    file_format = tips_file_format(path)
+    tmp_path = path + '.tmp'
+    exported = 0
+    try:
+        with open(tmp_path, 'w', newline='' if file_format == 'csv' else None, encoding='utf-8') as f:
+            writer = csv.writer(f) if file_format == 'csv' else None
+            if writer:
+                writer.writerow(EXPORT_FIELDS)
+            elif file_format == 'json':
+                f.write('[')
+            for page in repository.iter_tip_pages(page_size):
+                for tip in page:
+                    row = [getattr(tip, field) for field in EXPORT_FIELDS]
+                    if writer:
+                        writer.writerow(row)
+                    elif file_format == 'json':
+                        f.write((',\n' if exported else '\n') + json.dumps(dict(zip(EXPORT_FIELDS, row))))
+                    else:
+                        f.write(json.dumps(dict(zip(EXPORT_FIELDS, row))) + '\n')
+                    exported += 1
+                if on_progress:
+                    on_progress(exported)
+            if file_format == 'json':
+                f.write('\n]\n')
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return exported
+
+# --- Realtime Updates ---
+class TipsListener:
+    """Keeps the local cache current through the repository's change feed.
+
+    The listener watches tips whose `updated_at` is newer than the last sync,
+    so the initial snapshot only carries what changed while the app was closed
+    and every later insert or status change arrives as a single-document diff.
+    `on_changes` is called on the Kivy main thread with a list of
+    (change_type, Tip) tuples, change_type being 'ADDED', 'MODIFIED' or
+    'REMOVED'.
+    """
+
+    def __init__(self, repository, cache, on_changes, on_stats_changes=None):
+        self.repository = repository
+        self.cache = cache
+        self.on_changes = on_changes
+        self.on_stats_changes = on_stats_changes
+        self._unsubscribe = None
+
+    @property
+    def active(self):
+        return self._unsubscribe is not None
+
+    def start(self, since):
+        """Starts listening for tips changed after `since` (epoch seconds) and for aggregate changes."""
+        self.stop()
+        # The aggregates are one small document per user, mirrored so user views read their totals locally
+        self._unsubscribe = self.repository.watch(since, self._on_tip_changes, self._on_stats_changes)
+
+    def stop(self):
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _on_stats_changes(self, stats_by_user):
+        for user, stats in stats_by_user.items():
+            self.cache.set_user_stats(user, stats)
+        users = list(stats_by_user)
+        if users and self.on_stats_changes:
+            Clock.schedule_once(lambda dt: self.on_stats_changes(users), 0)
+
+    def _on_tip_changes(self, diffs):
+        # Runs on a backend thread: update the cache here, the UI on the main thread
+        if not diffs:
+            return
+        self.cache.upsert_tips([tip for kind, tip in diffs if kind != 'REMOVED'])
+        self.cache.delete_tips([tip.id for kind, tip in diffs if kind == 'REMOVED'])
+        seen = [tip.updated_at or 0 for kind, tip in diffs]
+        self.cache.set_meta('last_sync', max(seen + [self.cache.get_meta('last_sync', 0)]))
+        Clock.schedule_once(lambda dt: self.on_changes(diffs), 0)
+
+# --- Tips Table (virtualized) ---
+TABLE_HEADERS = ["User", "Team1", "Team2", "Bet", "Competition", "Date", "Value", "Odd", "Profit", "Actions"]
+HEADER_BG_COLOR = (0.4, 0.4, 0.4, 1)
+ROW_COLORS = [(0.22, 0.22, 0.22, 1), (0.20, 0.20, 0.20, 1)]
+ROW_HEIGHT = dp(35)
+CELL_HEIGHT = dp(30)
+TIPS_PAGE_SIZE = 50
+PREFETCH_ROWS = 10  # Start loading the next page this many rows before the end
+
+def format_profit(tip):
+    """Returns the profit column text for a Tip."""
+    return str(tip.profit) if tip.status in ('Win', 'Loose') else 'Pending'
+
+def _cell_text(value):
+    return 'N/A' if value is None else str(value)
+
+def tip_to_row_data(tip):
+    """Converts a Tip into a RecycleView data entry."""
+    return {
+        'tip_id': tip.id,
+        'user': _cell_text(tip.user),
+        'cells': [
+            _cell_text(tip.team1),
+            _cell_text(tip.team2),
+            _cell_text(tip.bet),
+            _cell_text(tip.competition),
+            _cell_text(tip.date),
+            _cell_text(tip.value),
+            _cell_text(tip.odd),
+            format_profit(tip),
+        ],
+        'status': tip.status,
+    }
+
+ACTION_SPACING = dp(10)
+BADGE_RADIUS = dp(8)
+# Badge colors drawn behind the action buttons, left to right, for each status
+STATUS_BADGES = {
+    'Pending': [(0.2, 0.7, 0.2, 0.8), (0.8, 0.3, 0.3, 0.8)],  # WIN / LOOSE buttons
+    'Win': [(0.2, 0.7, 0.2, 0.9)],
+    'Loose': [(0.8, 0.3, 0.3, 0.9)],
+}
+
+class RowRenderer:
+    """Draws a row's background and its status badges from one place.
+
+    The row owns a single background rectangle; each status has an
+    InstructionGroup of rounded badges, built the first time the row shows
+    that status and swapped in afterwards. Only the group on screen is moved
+    when the row is laid out, so the canvas work per layout pass is a few
+    instructions per row rather than several per cell and button.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.bg_color = Color(*ROW_COLORS[0])
+        self.bg = Rectangle()
+        canvas.add(self.bg_color)
+        canvas.add(self.bg)
+        self._groups = {}  # status -> (InstructionGroup, [RoundedRectangle])
+        self._status = None
+        self._actions = ((0, 0), (0, 0))
+
+    def set_color(self, rgba):
+        if tuple(self.bg_color.rgba) != tuple(rgba):
+            self.bg_color.rgba = rgba
+
+    def layout(self, pos, size, action_pos, action_size):
+        self.bg.pos = pos
+        self.bg.size = size
+        self._actions = (action_pos, action_size)
+        self._place_badges()
+
+    def set_status(self, status):
+        if status == self._status:
+            return
+        if self._status in self._groups:
+            self.canvas.remove(self._groups[self._status][0])
+        self._status = status
+        if status not in self._groups:
+            group = InstructionGroup()
+            badges = []
+            for rgba in STATUS_BADGES.get(status, STATUS_BADGES['Pending']):
+                group.add(Color(*rgba))
+                badge = RoundedRectangle(radius=[BADGE_RADIUS])
+                group.add(badge)
+                badges.append(badge)
+            self._groups[status] = (group, badges)
+        self.canvas.add(self._groups[status][0])
+        self._place_badges()
+
+    def _place_badges(self):
+        if self._status not in self._groups:
+            return
+        badges = self._groups[self._status][1]
+        (x, y), (width, height) = self._actions
+        badge_width = (width - ACTION_SPACING * (len(badges) - 1)) / len(badges)
+        for i, badge in enumerate(badges):
+            badge.pos = (x + i * (badge_width + ACTION_SPACING), y)
+            badge.size = (badge_width, height)
+
+class TipRow(RecycleDataViewBehavior, BoxLayout):
+    """A single table row. Widgets are created once and re-filled by the RecycleView.
+
+    Cells and buttons draw no backgrounds of their own; the row's
+    RowRenderer paints the row and the status badges behind the buttons.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='horizontal', spacing=dp(2), **kwargs)
+        self.index = 0
+        self.tip_id = None
+        self.renderer = RowRenderer(self.canvas.before)
+
+        self.user_button = Button(
+            text='', font_size='14sp',
+            size_hint_y=None, height=CELL_HEIGHT,
+            halign='center', valign='middle',
+            background_normal='', background_down='',
+            background_color=(0, 0, 0, 0),
+            color=(0.8, 0.8, 1, 1)  # Light blue text for username
+        )
+        self.user_button.bind(on_press=self._on_user_press)
+        self.add_widget(self.user_button)
+
+        self.cell_labels = []
+        for _ in range(len(TABLE_HEADERS) - 2):
+            cell = Label(
+                text='', font_size='14sp',
+                size_hint_y=None, height=CELL_HEIGHT,
+                halign='center', valign='middle',
+                text_size=(None, CELL_HEIGHT),
+                shorten=True, shorten_from='right'
+            )
+            self.cell_labels.append(cell)
+            self.add_widget(cell)
+
+        # --- Action Buttons (swapped in/out depending on the tip status) ---
+        self.action_layout = BoxLayout(orientation='horizontal', spacing=ACTION_SPACING, size_hint_y=None, height=ROW_HEIGHT)
+
+        def action_button(text, size_hint_x, **kwargs):
+            # Transparent: the badge behind it is drawn by the row renderer
+            return Button(
+                text=text, font_size='14sp', size_hint_x=size_hint_x,
+                background_normal='', background_down='', background_disabled_normal='',
+                background_color=(0, 0, 0, 0),
+                color=(1, 1, 1, 0.9),
+                bold=True, **kwargs
+            )
+
+        self.win_button = action_button("WIN", 0.5)
+        self.win_button.bind(on_press=lambda instance: self._on_status_press('Win', instance))
+        self.loose_button = action_button("LOOSE", 0.5)
+        self.loose_button.bind(on_press=lambda instance: self._on_status_press('Loose', instance))
+        self.win_status_button = action_button("✓ WIN", 1, disabled=True)
+        self.loose_status_button = action_button("✗ LOOSE", 1, disabled=True)
+
+        self.add_widget(self.action_layout)
+        self._shown_status = None
+        # One layout callback for the whole row
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+        self.action_layout.bind(pos=self._update_canvas, size=self._update_canvas)
+
+    def _update_canvas(self, instance, value):
+        self.renderer.layout(self.pos, self.size, self.action_layout.pos, self.action_layout.size)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Fills the recycled row with the values of the data entry at `index`."""
+        self.index = index
+        self.tip_id = data['tip_id']
+        self.renderer.set_color(ROW_COLORS[index % 2])
+        self.user_button.text = data['user']
+        for label, text in zip(self.cell_labels, data['cells']):
+            label.text = text
+        self._show_status(data['status'])
+
+        # Keep the buttons disabled if this tip has an update in flight
+        app = App.get_running_app()
+        busy = app is not None and self.tip_id in getattr(app, 'updating_tip_ids', ())
+        self.win_button.disabled = busy
+        self.loose_button.disabled = busy
+
+    def _show_status(self, status):
+        if status == self._shown_status:
+            return
+        self._shown_status = status
+        self.renderer.set_status(status)
+        self.action_layout.clear_widgets()
+        if status == 'Win':
+            self.action_layout.add_widget(self.win_status_button)
+        elif status == 'Loose':  # Keeping 'Loose' for consistency with existing data
+            self.action_layout.add_widget(self.loose_status_button)
+        else:  # Pending status
+            self.action_layout.add_widget(self.win_button)
+            self.action_layout.add_widget(self.loose_button)
+
+    def _on_user_press(self, instance):
+        App.get_running_app().filter_tips_by_user(instance.text)
+
+    def _on_status_press(self, new_status, instance):
+        App.get_running_app().update_tip_status(self.tip_id, new_status, instance)
+
+class TipsTable(BoxLayout):
+    """Fixed header plus a RecycleView that only builds widgets for the visible rows.
+
+    `on_near_end` is called (without arguments) when the user scrolls within
+    PREFETCH_ROWS rows of the bottom, so the next page can be fetched early.
+    """
+
+    def __init__(self, on_near_end=None, **kwargs):
+        super().__init__(orientation='vertical', size_hint=(1, 1), **kwargs)
+        self.on_near_end = on_near_end
+
+        header_layout = BoxLayout(
+            orientation='horizontal', size_hint_y=None, height=dp(40),
+            spacing=dp(2), padding=[dp(10), 0]
+        )
+        with header_layout.canvas.before:
+            Color(*HEADER_BG_COLOR)
+            header_layout._header_bg = Rectangle(pos=header_layout.pos, size=header_layout.size)
+        header_layout.bind(
+            pos=lambda instance, value: setattr(instance._header_bg, 'pos', instance.pos),
+            size=lambda instance, value: setattr(instance._header_bg, 'size', instance.size)
+        )
+        for header in TABLE_HEADERS:
+            header_layout.add_widget(Label(text=header, bold=True, font_size='16sp'))
+        self.add_widget(header_layout)
+
+        self.recycle_view = RecycleView(size_hint=(1, 1), bar_width=dp(10), scroll_type=['bars', 'content'])
+        self.recycle_view.viewclass = TipRow
+        rows_layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, ROW_HEIGHT),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=dp(2),
+            padding=[dp(10), dp(2)]
+        )
+        rows_layout.bind(minimum_height=rows_layout.setter('height'))
+        self.recycle_view.add_widget(rows_layout)
+        self.recycle_view.bind(scroll_y=self._check_near_end)
+        self.add_widget(self.recycle_view)
+
+    def set_tips(self, tips):
+        """Shows the given list of Tips, touching only the rows whose content changed.
+
+        The new row models are diffed against the current ones: the unchanged
+        head and tail are kept, and what lies between is either updated row
+        by row or replaced in a single change.
+        """
+        rows = [tip_to_row_data(tip) for tip in tips]
+        data = self.recycle_view.data
+        start, end_old, end_new = 0, len(data), len(rows)
+        while start < min(end_old, end_new) and data[start] == rows[start]:
+            start += 1
+        while end_old > start and end_new > start and data[end_old - 1] == rows[end_new - 1]:
+            end_old -= 1
+            end_new -= 1
+        if end_old - start != end_new - start:
+            data[start:end_old] = rows[start:end_new]
+            return
+        changed = [index for index in range(start, end_new) if data[index] != rows[index]]
+        if len(changed) > len(rows) // 2:
+            self.recycle_view.data = rows
+            return
+        for index in changed:
+            data[index] = rows[index]
+
+    def append_tips(self, tips):
+        """Appends a page of Tips without touching the rows already shown."""
+        self.recycle_view.data.extend(tip_to_row_data(tip) for tip in tips)
+
+    def update_row(self, index, tip):
+        """Redraws only the row at `index`."""
+        self.recycle_view.data[index] = tip_to_row_data(tip)
+
+    def insert_row(self, index, tip):
+        self.recycle_view.data.insert(index, tip_to_row_data(tip))
+
+    def remove_row(self, index):
+        del self.recycle_view.data[index]
+
+    def _check_near_end(self, instance, scroll_y):
+        if not self.on_near_end:
+            return
+        rv = self.recycle_view
+        scrollable_height = rv.children[0].height - rv.height if rv.children else 0
+        # scroll_y goes from 1 (top) to 0 (bottom)
+        if scrollable_height <= 0 or scroll_y * scrollable_height <= PREFETCH_ROWS * ROW_HEIGHT:
+            self.on_near_end()
+
+# --- Tips Index & Filters ---
+INDEXED_FIELDS = ('user', 'sport', 'competition', 'status', 'live')
+ANY = 'Any'
+STATUS_CHOICES = ('Pending', 'Win', 'Loose')
+LIVE_CHOICES = {'Yes': True, 'No': False}
+
+def text_tokens(text):
+    """Splits text into the lowercase words the team search matches on."""
+    return re.findall(r'\w+', text.lower()) if text else []
+
+def tip_matches(tip, criteria):
+    """Whether a single tip passes the filter `criteria` (see TipsIndex.query)."""
+    for field in INDEXED_FIELDS:
+        if criteria.get(field) is not None and getattr(tip, field) != criteria[field]:
+            return False
+    for low, high, value in ((criteria.get('date_from'), criteria.get('date_to'), tip.date),
+                             (criteria.get('odd_min'), criteria.get('odd_max'), tip.odd)):
+        if low is None and high is None:
+            continue
+        if value is None or (low is not None and value < low) or (high is not None and value > high):
+            return False
+    words = text_tokens(f"{tip.team1 or ''} {tip.team2 or ''}")
+    return all(any(word.startswith(prefix) for word in words) for prefix in text_tokens(criteria.get('text')))
+
+class SortedIndex:
+    """Keys kept sorted next to the tip ids they belong to, for range lookups with bisect."""
+
+    def __init__(self, pairs=()):
+        pairs = sorted(pairs)
+        self.keys = [key for key, tip_id in pairs]
+        self.ids = [tip_id for key, tip_id in pairs]
+
+    def add(self, key, tip_id):
+        index = bisect.bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.ids.insert(index, tip_id)
+
+    def remove(self, key, tip_id):
+        low = bisect.bisect_left(self.keys, key)
+        high = bisect.bisect_right(self.keys, key)
+        index = low + self.ids[low:high].index(tip_id)
+        del self.keys[index]
+        del self.ids[index]
+
+    def range(self, low=None, high=None):
+        """Returns the ids whose key lies in [low, high]; either end may be open (None)."""
+        start = 0 if low is None else bisect.bisect_left(self.keys, low)
+        end = len(self.keys) if high is None else bisect.bisect_right(self.keys, high)
+        return set(self.ids[start:end])
+
+class WordIndex:
+    """Inverted index from words to tip ids, answering word-prefix lookups.
+
+    The distinct words are kept sorted, so the words starting with a prefix
+    are one bisect range; a complete word hits its id set directly.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._sorted_words = None  # Rebuilt on demand after new words arrive
+
+    def add(self, word, tip_id):
+        ids = self._ids.get(word)
+        if ids is None:
+            ids = self._ids[word] = set()
+            self._sorted_words = None
+        ids.add(tip_id)
+
+    def remove(self, word, tip_id):
+        self._ids[word].discard(tip_id)
+
+    def prefix(self, prefix):
+        """Returns the ids of the tips having a word that starts with `prefix` (do not modify it)."""
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._ids)
+        start = bisect.bisect_left(self._sorted_words, prefix)
+        end = bisect.bisect_left(self._sorted_words, prefix + '\U0010ffff')
+        sets = [self._ids[word] for word in self._sorted_words[start:end]]
+        if len(sets) == 1:
+            return sets[0]
+        return set().union(*sets)
+
+class TipsIndex:
+    """In-memory indexes over the cached tips, so filters are answered without a query.
+
+    Categorical fields (INDEXED_FIELDS) map each value to the set of tip ids
+    having it, dates and odds are SortedIndexes searched with bisect, and
+    the words of the team names go into a WordIndex, so the word being
+    typed is matched as a prefix. A query intersects the candidate sets,
+    smallest first.
+    """
+
+    def __init__(self, tips=()):
+        self._tips = {tip.id: tip for tip in tips}
+        self._values = {field: {} for field in INDEXED_FIELDS}
+        for tip in self._tips.values():
+            for field in INDEXED_FIELDS:
+                self._values[field].setdefault(self._value(tip, field), set()).add(tip.id)
+        self._dates = SortedIndex((tip.date, tip.id) for tip in self._tips.values() if tip.date is not None)
+        self._odds = SortedIndex((tip.odd, tip.id) for tip in self._tips.values() if tip.odd is not None)
+        self._words = WordIndex()
+        for tip in self._tips.values():
+            for word in self._tip_words(tip):
+                self._words.add(word, tip.id)
+        self._ordered = None  # Newest-first list of all tips, rebuilt on demand after changes
+        self.ordered()
+
+    def __len__(self):
+        return len(self._tips)
+
+    @staticmethod
+    def _value(tip, field):
+        value = getattr(tip, field)
+        return bool(value) if field == 'live' else value
+
+    @staticmethod
+    def _tip_words(tip):
+        return set(text_tokens(f"{tip.team1 or ''} {tip.team2 or ''}"))
+
+    def values(self, field):
+        """Returns the distinct non-empty values of a categorical field, sorted."""
+        return sorted(value for value, ids in self._values[field].items() if ids and value not in (None, ''))
+
+    def _add(self, tip):
+        self._tips[tip.id] = tip
+        for field in INDEXED_FIELDS:
+            self._values[field].setdefault(self._value(tip, field), set()).add(tip.id)
+        if tip.date is not None:
+            self._dates.add(tip.date, tip.id)
+        if tip.odd is not None:
+            self._odds.add(tip.odd, tip.id)
+        for word in self._tip_words(tip):
+            self._words.add(word, tip.id)
+
+    def _remove(self, tip_id):
+        tip = self._tips.pop(tip_id, None)
+        if tip is None:
+            return
+        for field in INDEXED_FIELDS:
+            self._values[field][self._value(tip, field)].discard(tip_id)
+        if tip.date is not None:
+            self._dates.remove(tip.date, tip_id)
+        if tip.odd is not None:
+            self._odds.remove(tip.odd, tip_id)
+        for word in self._tip_words(tip):
+            self._words.remove(word, tip_id)
+
+    def apply(self, changes):
+        """Applies (change_type, Tip) diffs, as delivered by TipsListener."""
+        for kind, tip in changes:
+            self._remove(tip.id)
+            if kind != 'REMOVED' and tip.inserted_at is not None:
+                self._add(tip)
+        self._ordered = None
+
+    def ordered(self):
+        if self._ordered is None:
+            self._ordered = sorted(self._tips.values(), key=lambda tip: tip.inserted_at, reverse=True)
+        return self._ordered
+
+    def query(self, criteria):
+        """Returns a TipsResult over the tips matching `criteria`.
+
+        `criteria` may hold a value for any of INDEXED_FIELDS, `date_from` /
+        `date_to` (YYYY-MM-DD, inclusive), `odd_min` / `odd_max` (inclusive)
+        and `text`, whose words must each start a word of team1 or team2.
+        """
+        candidates = []
+        for field in INDEXED_FIELDS:
+            if criteria.get(field) is not None:
+                candidates.append(self._values[field].get(criteria[field], set()))
+        if criteria.get('date_from') is not None or criteria.get('date_to') is not None:
+            candidates.append(self._dates.range(criteria.get('date_from'), criteria.get('date_to')))
+        if criteria.get('odd_min') is not None or criteria.get('odd_max') is not None:
+            candidates.append(self._odds.range(criteria.get('odd_min'), criteria.get('odd_max')))
+        for prefix in text_tokens(criteria.get('text')):
+            candidates.append(self._words.prefix(prefix))
+        if not candidates:
+            return TipsResult(None, self.ordered())
+        candidates.sort(key=len)
+        # The index's own sets are never modified here, so a single one is used as is
+        matched = candidates[0].intersection(*candidates[1:]) if len(candidates) > 1 else candidates[0]
+        if len(matched) * 8 < len(self._tips):
+            # Few matches: sorting them is cheaper than scanning every tip in order
+            return TipsResult(None, sorted((self._tips[tip_id] for tip_id in matched),
+                                           key=lambda tip: tip.inserted_at, reverse=True))
+        return TipsResult(matched, self.ordered())
+
+class TipsResult:
+    """Matches of a TipsIndex query, handed out newest first one page at a time.
+
+    With many matches the newest-first list of all tips is scanned only as
+    far as the pages asked for, so a broad query costs no more than its set
+    intersection. `ids` None means every tip in `ordered` matches.
+    """
+
+    def __init__(self, ids, ordered):
+        self._ids = ids
+        self._ordered = ordered
+        self._position = 0
+        self._count = len(ordered) if ids is None else len(ids)
+
+    def __len__(self):
+        return self._count
+
+    def next_page(self, size):
+        """Returns the next `size` matching tips (fewer at the end)."""
+        if self._ids is None:
+            page = self._ordered[self._position:self._position + size]
+            self._position += len(page)
+            return page
+        page = []
+        while len(page) < size and self._position < len(self._ordered):
+            tip = self._ordered[self._position]
+            self._position += 1
+            if tip.id in self._ids:
+                page.append(tip)
+        return page
+
+class FilterBar(BoxLayout):
+    """Team search plus field filters shown above the tips table.
+
+    `on_change(criteria)` is called at most once per frame while the user
+    types or picks values, with only the fields that are set.
+    """
+
+    def __init__(self, on_change, **kwargs):
+        super().__init__(orientation='vertical', size_hint_y=None, height=dp(84), spacing=dp(4), **kwargs)
+        self.on_change = on_change
+        self._trigger_change = Clock.create_trigger(lambda dt: self.on_change(self.criteria()))
+
+        first_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40), spacing=dp(6))
+        self.search_input = TextInput(hint_text='Search teams', multiline=False, size_hint_x=0.3)
+        first_row.add_widget(self.search_input)
+        self.spinners = {
+            'sport': Spinner(text=ANY, values=(ANY,), size_hint_x=0.18),
+            'competition': Spinner(text=ANY, values=(ANY,), size_hint_x=0.22),
+            'status': Spinner(text=ANY, values=(ANY,) + STATUS_CHOICES, size_hint_x=0.15),
+            'live': Spinner(text=ANY, values=(ANY,) + tuple(LIVE_CHOICES), size_hint_x=0.15),
+        }
+        for spinner in self.spinners.values():
+            first_row.add_widget(spinner)
+        self.add_widget(first_row)
+
+        second_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40), spacing=dp(6))
+        self.date_from_input = TextInput(hint_text='From YYYY-MM-DD', multiline=False, input_filter=date_filter)
+        self.date_to_input = TextInput(hint_text='To YYYY-MM-DD', multiline=False, input_filter=date_filter)
+        self.odd_min_input = TextInput(hint_text='Min odd', multiline=False, input_filter=odd_filter)
+        self.odd_max_input = TextInput(hint_text='Max odd', multiline=False, input_filter=odd_filter)
+        for text_input in (self.date_from_input, self.date_to_input, self.odd_min_input, self.odd_max_input):
+            second_row.add_widget(text_input)
+        self.status_label = Label(text='', color=(0.8, 0.8, 0.8, 1))
+        second_row.add_widget(self.status_label)
+        clear_button = Button(
+            text='Clear', size_hint_x=0.5,
+            background_normal='', background_color=(0.4, 0.4, 0.6, 1), color=(1, 1, 1, 1)
+        )
+        clear_button.bind(on_press=lambda instance: self.clear())
+        second_row.add_widget(clear_button)
+        self.add_widget(second_row)
+
+        for widget in [self.search_input, self.date_from_input, self.date_to_input,
+                       self.odd_min_input, self.odd_max_input] + list(self.spinners.values()):
+            widget.bind(text=lambda instance, value: self._trigger_change())
+
+    def set_choices(self, sports, competitions):
+        self.spinners['sport'].values = (ANY,) + tuple(sports)
+        self.spinners['competition'].values = (ANY,) + tuple(competitions)
+
+    def set_status(self, text):
+        self.status_label.text = text
+
+    def clear(self):
+        for text_input in (self.search_input, self.date_from_input, self.date_to_input,
+                           self.odd_min_input, self.odd_max_input):
+            text_input.text = ''
+        for spinner in self.spinners.values():
+            spinner.text = ANY
+
+    def reset(self):
+        """Clears every filter without reporting a change (for a new view)."""
+        self.clear()
+        self._trigger_change.cancel()
+        self.set_status('')
+
+    def criteria(self):
+        """Returns the current filters; half-typed dates and odds are ignored until they are valid."""
+        criteria = {}
+        if self.search_input.text.strip():
+            criteria['text'] = self.search_input.text.strip()
+        for field, spinner in self.spinners.items():
+            if spinner.text != ANY:
+                criteria[field] = LIVE_CHOICES[spinner.text] if field == 'live' else spinner.text
+        for key, text_input in (('date_from', self.date_from_input), ('date_to', self.date_to_input)):
+            if re.fullmatch(r'\d{4}-\d{2}-\d{2}', text_input.text):
+                criteria[key] = text_input.text
+        for key, text_input in (('odd_min', self.odd_min_input), ('odd_max', self.odd_max_input)):
+            try:
+                criteria[key] = float(text_input.text)
+            except ValueError:
+                pass
+        return criteria
+
+# --- Analytics ---
+ODDS_BUCKET_EDGES = [1.5, 2.0, 2.5, 3.0, 5.0]
+ROLLING_WINDOW = 20  # Settled tips in the "recent form" profit
+GROUP_BY_COLUMNS = {'User': 'user', 'Sport': 'sport', 'Competition': 'competition'}
+STATUS_PENDING, STATUS_WIN, STATUS_LOOSE = 0, 1, 2
+
+def require_numpy():
+    """Imports NumPy on first use; the analytics screen is the only part of the app that needs it."""
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("The analytics screen needs NumPy (pip install numpy).")
+    return numpy
+
+class TipsFrame:
+    """Column-oriented copy of the tips for vectorized analytics.
+
+    Holds one NumPy array per field (`user`, `sport`, `competition`, `odd`,
+    `value`, `status`, `date`); categorical fields are also factorized into
+    integer codes so group-bys are a single `bincount`.
+    """
+
+    def __init__(self, rows):
+        np = self.np = require_numpy()
+        users, sports, competitions, odds, values, statuses, dates = zip(*rows) if rows else ((),) * 7
+        self.size = len(users)
+        self.odd = np.array(odds, dtype=float)
+        self.value = np.nan_to_num(np.array(values, dtype=float))
+        self.status = np.array(statuses, dtype=np.int8)
+        self.date = np.array(dates, dtype='datetime64[D]')
+        self.labels = {}
+        self.codes = {}
+        for name, column in (('user', users), ('sport', sports), ('competition', competitions)):
+            self.labels[name], self.codes[name] = np.unique(np.array(column, dtype=str), return_inverse=True)
+
+        self.is_win = self.status == STATUS_WIN
+        self.settled = self.status != STATUS_PENDING
+        odd = np.nan_to_num(self.odd)
+        self.profit = np.where(self.is_win, self.value * odd - self.value,
+                               np.where(self.status == STATUS_LOOSE, -self.value, 0.0))
+
+    def summary(self, by):
+        """Per-group totals for `by` in ('user', 'sport', 'competition').
+
+        ROI is profit over the settled stake, yield is profit over everything
+        staked (pending tips included) and hit rate is wins over settled tips.
+        """
+        np = self.np
+        codes, groups = self.codes[by], len(self.labels[by])
+        count = lambda weights=None: np.bincount(codes, weights=weights, minlength=groups)
+        tips = count()
+        staked = count(self.value)
+        settled_staked = count(self.value * self.settled)
+        settled = count(self.settled)
+        profit = count(self.profit)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'labels': self.labels[by],
+                'tips': tips,
+                'staked': staked,
+                'profit': profit,
+                'roi': profit / settled_staked,
+                'yield': profit / staked,
+                'hit_rate': count(self.is_win) / settled,
+                'recent_profit': self.rolling_profit(by, ROLLING_WINDOW),
+            }
+
+    def rolling_profit(self, by, window=None):
+        """Profit of each group's last `window` settled tips by date (all of them if window is None)."""
+        np = self.np
+        groups = len(self.labels[by])
+        settled = np.flatnonzero(self.settled)
+        if not len(settled):
+            return np.zeros(groups)
+        codes = self.codes[by][settled]
+        order = np.lexsort((self.date[settled].astype('int64'), codes))
+        codes, profit = codes[order], self.profit[settled][order]
+
+        # Running total within each group: global cumsum minus the total before the group starts
+        running = np.cumsum(profit)
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        sizes = np.diff(np.r_[starts, len(codes)])
+        group_start = np.repeat(starts, sizes)
+        before_group = np.repeat(running[starts] - profit[starts], sizes)
+        running = running - before_group
+        if window:
+            back = np.arange(len(codes)) - window
+            in_group = back >= group_start
+            running = running - np.where(in_group, running[np.maximum(back, 0)], 0.0)
+
+        result = np.zeros(groups)
+        result[codes[starts + sizes - 1]] = running[starts + sizes - 1]
+        return result
+
+    def odds_buckets(self):
+        """Settled tips, wins and hit rate per odds bucket (see ODDS_BUCKET_EDGES)."""
+        np = self.np
+        valid = self.settled & ~np.isnan(self.odd)
+        buckets = np.digitize(self.odd[valid], ODDS_BUCKET_EDGES)
+        size = len(ODDS_BUCKET_EDGES) + 1
+        settled = np.bincount(buckets, minlength=size)
+        wins = np.bincount(buckets, weights=self.is_win[valid], minlength=size)
+        edges = [1.0] + ODDS_BUCKET_EDGES
+        labels = [f"{low:.2f}-{high:.2f}" for low, high in zip(edges, edges[1:])] + [f"{edges[-1]:.2f}+"]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {'labels': labels, 'settled': settled, 'wins': wins, 'hit_rate': wins / settled}
+
+def format_ratio(value):
+    """Formats a ratio as a percentage, '-' for NaN/inf (nothing to divide by)."""
+    return f"{value:.1%}" if value == value and abs(value) != float('inf') else '-'
+
+class TextRow(RecycleDataViewBehavior, BoxLayout):
+    """Row of plain labels for the analytics tables."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='horizontal', spacing=dp(2), **kwargs)
+        with self.canvas.before:
+            self._bg_color = Color(*ROW_COLORS[0])
+            self._bg = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._update_bg, size=self._update_bg)
+        self.cell_labels = []
+
+    def _update_bg(self, instance, value):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+    def refresh_view_attrs(self, rv, index, data):
+        self._bg_color.rgba = ROW_COLORS[index % 2]
+        cells = data['cells']
+        while len(self.cell_labels) < len(cells):
+            label = Label(font_size='14sp', shorten=True, shorten_from='right')
+            self.cell_labels.append(label)
+            self.add_widget(label)
+        for label, text in zip(self.cell_labels, cells):
+            label.text = text
+
+class SimpleTable(BoxLayout):
+    """Header plus a RecycleView of text rows."""
+
+    def __init__(self, headers, **kwargs):
+        super().__init__(orientation='vertical', **kwargs)
+        header_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40), spacing=dp(2))
+        with header_layout.canvas.before:
+            Color(*HEADER_BG_COLOR)
+            header_layout._header_bg = Rectangle(pos=header_layout.pos, size=header_layout.size)
+        header_layout.bind(
+            pos=lambda instance, value: setattr(instance._header_bg, 'pos', instance.pos),
+            size=lambda instance, value: setattr(instance._header_bg, 'size', instance.size)
+        )
+        for header in headers:
+            header_layout.add_widget(Label(text=header, bold=True, font_size='16sp'))
+        self.add_widget(header_layout)
+
+        self.recycle_view = RecycleView(size_hint=(1, 1), bar_width=dp(10), scroll_type=['bars', 'content'])
+        self.recycle_view.viewclass = TextRow
+        rows_layout = RecycleBoxLayout(
+            orientation='vertical', default_size=(None, ROW_HEIGHT), default_size_hint=(1, None),
+            size_hint_y=None, spacing=dp(2)
+        )
+        rows_layout.bind(minimum_height=rows_layout.setter('height'))
+        self.recycle_view.add_widget(rows_layout)
+        self.add_widget(self.recycle_view)
+
+    def set_rows(self, rows):
+        self.recycle_view.data = [{'cells': cells} for cells in rows]
+
+class AnalyticsView(BoxLayout):
+    """Dashboard over every cached tip: per-group ROI/yield/hit rate and odds-bucket hit rates."""
+
+    def __init__(self, on_load_history, **kwargs):
+        super().__init__(orientation='vertical', spacing=dp(10), **kwargs)
+        self.frame = None
+
+        controls = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40), spacing=dp(10))
+        controls.add_widget(Label(text='Group by:', size_hint_x=0.15))
+        self.group_spinner = Spinner(text='User', values=tuple(GROUP_BY_COLUMNS), size_hint_x=0.25)
+        self.group_spinner.bind(text=lambda instance, value: self.refresh())
+        controls.add_widget(self.group_spinner)
+        self.info_label = Label(text='Loading tips...', size_hint_x=0.35, color=(0.8, 0.8, 0.8, 1))
+        controls.add_widget(self.info_label)
+        history_button = Button(
+            text='Load full history', size_hint_x=0.25,
+            background_normal='', background_color=(0.4, 0.4, 0.6, 1), color=(1, 1, 1, 1)
+        )
+        history_button.bind(on_press=lambda instance: on_load_history())
+        controls.add_widget(history_button)
+        self.add_widget(controls)
+
+        self.summary_table = SimpleTable(
+            ['Group', 'Tips', 'Staked', 'Profit', 'ROI', 'Yield', 'Hit rate', f'Last {ROLLING_WINDOW}'],
+            size_hint_y=0.65
+        )
+        self.add_widget(self.summary_table)
+        self.buckets_table = SimpleTable(['Odds', 'Settled', 'Wins', 'Hit rate'], size_hint_y=0.35)
+        self.add_widget(self.buckets_table)
+
+    def set_frame(self, frame):
+        self.frame = frame
+        self.refresh()
+
+    def show_message(self, text):
+        self.info_label.text = text
+
+    def refresh(self):
+        if self.frame is None:
+            return
+        summary = self.frame.summary(GROUP_BY_COLUMNS[self.group_spinner.text])
+        order = summary['profit'].argsort()[::-1]  # Most profitable first
+        self.summary_table.set_rows([
+            [str(summary['labels'][i]) or 'N/A', str(summary['tips'][i]), f"{summary['staked'][i]:.2f}",
+             f"{summary['profit'][i]:.2f}", format_ratio(summary['roi'][i]), format_ratio(summary['yield'][i]),
+             format_ratio(summary['hit_rate'][i]), f"{summary['recent_profit'][i]:.2f}"]
+            for i in order
+        ])
+        buckets = self.frame.odds_buckets()
+        self.buckets_table.set_rows([
+            [label, str(buckets['settled'][i]), str(int(buckets['wins'][i])), format_ratio(buckets['hit_rate'][i])]
+            for i, label in enumerate(buckets['labels'])
+        ])
+        self.info_label.text = f"{self.frame.size} tips"
+
 # --- Main App Class ---
 class MainApp(App):
     def build(self):
         Window.clearcolor = (0.15, 0.15, 0.15, 1)
+        self.updating_tip_ids = set()
+        self.tips_cache = TipsCache(os.path.join(self.user_data_dir, 'tips_cache.sqlite3'))
+        self.data_access = DataAccess()
+        if STORAGE_BACKEND == 'local':
+            self.repository = LocalTipsRepository(os.path.join(self.user_data_dir, 'local_tips.sqlite3'))
+        else:
+            self.repository = FirestoreTipsRepository()
+        self.tips_listener = TipsListener(self.repository, self.tips_cache, self.apply_tip_changes, self.apply_stats_changes)
+        self.write_queue = WriteQueue(
+            os.path.join(self.user_data_dir, 'pending_writes.json'), self.repository,
+            on_committed=lambda ops: Clock.schedule_once(lambda dt: self._on_writes_committed(ops), 0),
+            on_failed=lambda op, error: Clock.schedule_once(lambda dt: self._on_write_failed(op, error), 0)
+        )
+        # Paging state of the tips view (see _start_tips_view)
+        self.tips_user_filter = None
+        self.tips_cursor = None
+        self.tips_has_more = False
+        self.tips_page_loading = False
+        self.tips_data = []
+        # Filter bar state; the index covers every cached tip and outlives the view
+        self.tips_index = None
+        self.tips_filters = {}
+        self.tips_results = None
+        self.tips_history_requested = False
+        self.bulk_running = False  # An import or export is in progress
         self.main_layout = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(20))
         self.create_top_buttons()
-        self.show_tips(None) # Start by showing tips
+        # Every screen is built once and updated in place when shown again
+        self.screen_manager = ScreenManager(transition=NoTransition())
+        self.main_layout.add_widget(self.screen_manager)
+        self._show_screen('tips', self._build_tips_screen)
+        self.show_tips(None) # Start by showing tips (from the cache until the backend is up)
         return self.main_layout
 
+    def on_start(self):
+        Window.bind(on_flip=self._on_first_frame)
+        Window.bind(on_key_down=self._on_key_down)
+        self.frame_timer = FrameTimer(verbose=FRAME_TIMES)
+        self.timing_overlay = None
+        if FRAME_TIMES or UI_TRACE_PATH:
+            self.frame_timer.start()
+
+    def _on_first_frame(self, *args):
+        """Starts connecting the storage backend once the window has been drawn."""
+        Window.unbind(on_flip=self._on_first_frame)
+        startup_timer.mark('first_frame')
+        self.repository.start(self._on_repository_started)
+
+    def _on_repository_started(self):
+        startup_timer.mark('backend_ready')
+        Clock.schedule_once(self._on_repository_ready, 0)
+
+    def _on_repository_ready(self, dt):
+        if not self.repository.wait_ready(0):
+            return
+        since = self.tips_cache.get_meta('last_sync') or self.tips_cache.newest_inserted_at() or time.time()
+        self.tips_listener.start(since)
+
+    def on_stop(self):
+        self.tips_listener.stop()
+        self.data_access.shutdown()
+        if UI_TRACE_PATH:
+            self.export_ui_trace(UI_TRACE_PATH)
+
+    def _on_key_down(self, window, key, scancode, codepoint, modifiers):
+        if key == OVERLAY_KEY:
+            self.toggle_timing_overlay()
+            return True
+        if key == EXPORT_KEY:
+            self.export_ui_trace(UI_TRACE_PATH or os.path.join(self.user_data_dir, 'ui_trace.json'))
+            return True
+        return False
+
+    def toggle_timing_overlay(self):
+        """Shows or hides the frame time / interaction overlay (measuring frames while it is shown)."""
+        if self.timing_overlay is None:
+            self.timing_overlay = TimingOverlay(self.frame_timer)
+        if self.timing_overlay.parent is None:
+            self.frame_timer.start()
+            self.timing_overlay.show()
+        else:
+            self.timing_overlay.hide()
+            if not (FRAME_TIMES or UI_TRACE_PATH):
+                self.frame_timer.stop()
+
+    def export_ui_trace(self, path):
+        try:
+            ui_trace.export(path, self.frame_timer)
+            print(f"UI timings written to {path}")
+        except OSError as e:
+            print(f"Error writing UI timings to {path}: {e}")
+
+    def _finish_interaction_on_next_frame(self):
+        """Closes the current interaction once the frame showing its data has been drawn."""
+        interaction = ui_trace.current
+        if interaction is None or interaction.ended is not None:
+            return
+        data_ready = time.perf_counter()
+
+        def on_flip(*args):
+            Window.unbind(on_flip=on_flip)
+            ui_trace.add_span(interaction, 'first_frame', data_ready, time.perf_counter())
+            ui_trace.finish(interaction)
+        Window.bind(on_flip=on_flip)
+
     def create_top_buttons(self):
-        """Creates the top 'Tips' and 'Insert' navigation buttons."""
+        """Creates the top 'Tips', 'Insert' and 'Analytics' navigation buttons."""
         self.top_buttons_layout = BoxLayout(
             orientation='horizontal',
             size_hint_y=None,
@@ -128,17 +2492,39 @@ class MainApp(App):
         add_rounded_background(insert_button, insert_button_color, radius_dp=10)
         insert_button.bind(on_press=self.show_insert_form)
 
+        # --- Analytics Button ---
+        analytics_button_color = (0.5, 0.4, 0.8, 1)
+        analytics_button = Button(
+            text='Analytics',
+            size_hint_x=0.5,
+            background_normal='', background_down='', background_color=(0, 0, 0, 0),
+            color=(1, 1, 1, 1), font_size='18sp'
+        )
+        add_rounded_background(analytics_button, analytics_button_color, radius_dp=10)
+        analytics_button.bind(on_press=self.show_analytics)
+
         self.top_buttons_layout.add_widget(tips_button)
         self.top_buttons_layout.add_widget(insert_button)
+        self.top_buttons_layout.add_widget(analytics_button)
         # Ensure top buttons are always added first if they were cleared
         if not self.top_buttons_layout.parent:
              self.main_layout.add_widget(self.top_buttons_layout, index=len(self.main_layout.children)) # Add to top visually
 
+    def _show_screen(self, name, build_content):
+        """Makes `name` the current screen, building its content on first use."""
+        if not self.screen_manager.has_screen(name):
+            screen = Screen(name=name)
+            screen.add_widget(build_content())
+            self.screen_manager.add_widget(screen)
+        self.screen_manager.current = name
+
     def show_insert_form(self, instance):
-        """Clears the layout and displays the tip insertion form."""
-        self.main_layout.clear_widgets()
-        self.create_top_buttons() # Re-add top buttons
+        """Switches to the tip insertion form."""
+        self.data_access.new_view()  # Drop any tips page still in flight
+        self._show_screen('insert', self._build_insert_form)
 
+    def _build_insert_form(self):
+        """Builds the tip insertion form (once; it is kept with its field values)."""
         form_bg_color = (0.25, 0.25, 0.25, 1) # Optional: background for the whole form area
         form_layout = BoxLayout(orientation='vertical', spacing=dp(15), padding=dp(20))
         # If you want a background for the form itself:
@@ -253,51 +2639,99 @@ class MainApp(App):
         self.status_label = Label(text="", size_hint_y=None, height=dp(30))
         form_layout.add_widget(self.status_label)
 
-        # Add the form to the main layout
-        self.main_layout.add_widget(form_layout)
+        # --- Bulk Import / Export (.csv, .json or .jsonl) ---
+        bulk_layout = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=input_height)
+        self.bulk_path_container = create_input_container("File path (.csv, .json, .jsonl)")
+        bulk_layout.add_widget(self.bulk_path_container)
+        for text, handler in (("Import", self.start_import), ("Export", self.start_export)):
+            bulk_button = Button(
+                text=text, size_hint_x=0.25,
+                background_normal='', background_down='', background_color=(0, 0, 0, 0),
+                color=(1, 1, 1, 1), font_size='16sp'
+            )
+            add_rounded_background(bulk_button, (0.2, 0.5, 0.8, 1), radius_dp=10)
+            bulk_button.bind(on_press=handler)
+            bulk_layout.add_widget(bulk_button)
+        form_layout.add_widget(bulk_layout)
+        self.bulk_status_label = Label(text="", size_hint_y=None, height=dp(30))
+        form_layout.add_widget(self.bulk_status_label)
+        return form_layout
 
-    def insert_tip_to_firebase(self, instance):
-        """Validates input and inserts tip data into Firebase Firestore."""
-        if not FIREBASE_INITIALIZED or not db:
-            self.show_popup("Error", "Firebase not initialized. Check key file and connection.")
+    def _run_bulk(self, fn, *args):
+        """Runs an import or export on its own thread; progress and the result come back on the main thread."""
+        if self.bulk_running:
+            self.show_popup("Busy", "An import or export is already running.")
             return
+        self.bulk_running = True
 
-        try:
-            # Access the text from the TextInput widget *inside* the container
-            value_text = self.value_input_container.text_input_widget.text.strip()
-            if not value_text:
-                raise ValueError("Value cannot be empty")
-
-            # Get odd value and validate
-            odd_text = self.odd_input_container.text_input_widget.text.strip()
-            if not odd_text:
-                raise ValueError("Odd cannot be empty")
-
-            tip_data = {
-                'user': self.user_input_container.text_input_widget.text.strip(),
-                'team1': self.team1_input_container.text_input_widget.text.strip(),
-                'team2': self.team2_input_container.text_input_widget.text.strip(),
-                'competition': self.competition_input_container.text_input_widget.text.strip(),
-                'value': float(value_text),
-                'odd': float(odd_text),  # Add odd field
-                'bet': self.bet_input_container.text_input_widget.text.strip(),
-                'sport': self.sport_input_container.text_input_widget.text.strip(),
-                'date': self.date_input_container.text_input_widget.text.strip(),
-                'live': self.live_input.text == 'Yes',
-                'inserted_at': firestore.SERVER_TIMESTAMP,
-                'status': 'Pending'
-            }
+        def run():
+            try:
+                result, error = fn(*args), None
+            except Exception as e:
+                result, error = None, e
+            Clock.schedule_once(lambda dt: self._on_bulk_done(fn, result, error), 0)
+        threading.Thread(target=run, daemon=True).start()
+
+    def _set_bulk_status(self, text, color=(1, 1, 1, 1)):
+        self.bulk_status_label.text = text
+        self.bulk_status_label.color = color
 
-            # Basic Validation: check if required fields are filled
-            if not all([tip_data['user'], tip_data['team1'], tip_data['team2'], tip_data['competition'],
-                        tip_data['bet'], tip_data['sport'], tip_data['date']]):
-                raise ValueError("Please fill in all required fields (User, Team1, Team2, Competition, Bet, Sport, Date).")
+    def start_import(self, instance):
+        path = self.bulk_path_container.text_input_widget.text.strip()
+        if not os.path.isfile(path):
+            self.show_popup("Import Error", f"File not found: {path or '(no path)'}")
+            return
+        self._set_bulk_status("Importing...")
+        on_progress = lambda imported, skipped: Clock.schedule_once(
+            lambda dt: self._set_bulk_status(f"Importing... {imported} imported, {skipped} skipped"), 0)
+        self._run_bulk(import_tips, path, self.repository, on_progress)
+
+    def start_export(self, instance):
+        path = self.bulk_path_container.text_input_widget.text.strip()
+        try:
+            tips_file_format(path)
+        except ValueError as e:
+            self.show_popup("Export Error", str(e))
+            return
+        self._set_bulk_status("Exporting...")
+        on_progress = lambda exported: Clock.schedule_once(
+            lambda dt: self._set_bulk_status(f"Exporting... {exported} tips"), 0)
+        self._run_bulk(export_tips, path, self.repository, on_progress)
 
-            # Optional: Add more specific validation (e.g., date format) here if needed
-            # Example: Validate date format
-            if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', tip_data['date']):
-                 raise ValueError("Date must be in YYYY-MM-DD format.")
+    def _on_bulk_done(self, fn, result, error):
+        self.bulk_running = False
+        if error:
+            print(f"Bulk {fn.__name__} failed: {error}")
+            self._set_bulk_status(f"Failed: {error}", (0.9, 0.5, 0.5, 1))
+            return
+        if fn is export_tips:
+            self._set_bulk_status(f"Exported {result} tips.", (0.3, 0.9, 0.3, 1))
+            return
+        imported, skipped, errors = result
+        self._set_bulk_status(f"Imported {imported} tips, skipped {skipped}.",
+                              (0.9, 0.7, 0.3, 1) if skipped else (0.3, 0.9, 0.3, 1))
+        if errors:
+            details = "\n".join(f"Row {number}: {message}" for number, message in errors)
+            more = f"\n... and {skipped - len(errors)} more" if skipped > len(errors) else ''
+            self.show_popup("Skipped Rows", details + more)
 
+    def insert_tip_to_firebase(self, instance):
+        """Validates input and queues the tip for insertion into Firebase Firestore."""
+        try:
+            # Access the text from the TextInput widget *inside* the container;
+            # the rules are shared with the bulk import (tip_data_from_input)
+            tip_data = tip_data_from_input({
+                'user': self.user_input_container.text_input_widget.text,
+                'team1': self.team1_input_container.text_input_widget.text,
+                'team2': self.team2_input_container.text_input_widget.text,
+                'competition': self.competition_input_container.text_input_widget.text,
+                'value': self.value_input_container.text_input_widget.text,
+                'odd': self.odd_input_container.text_input_widget.text,
+                'bet': self.bet_input_container.text_input_widget.text,
+                'sport': self.sport_input_container.text_input_widget.text,
+                'date': self.date_input_container.text_input_widget.text,
+                'live': self.live_input.text == 'Yes',
+            })
         except ValueError as e:
             self.show_popup("Input Error", str(e))
             return
@@ -305,24 +2739,19 @@ class MainApp(App):
             self.show_popup("Input Error", f"Invalid input: {e}")
             return
 
-        # --- Perform Firestore Insertion ---
-        try:
-            # Disable button temporarily to prevent double clicks? (Optional)
-            # instance.disabled = True
-            doc_ref = db.collection('tips').add(tip_data)
-            self.status_label.text = f"Tip inserted successfully! ID: {doc_ref[1].id[:8]}..."
+        # --- Queue the Firestore Insertion ---
+        # The write queue commits in the background (inserted_at/updated_at are
+        # set server-side then); the tip shows up locally right away.
+        tip_id = self.write_queue.enqueue_insert(tip_data)
+        self.tips_cache.upsert_tips([Tip.from_dict(tip_id, dict(tip_data, inserted_at=time.time()))], pending=True)
+        if self.repository.starting or self.repository.wait_ready(0):
+            self.status_label.text = f"Tip saved! ID: {tip_id[:8]}... (syncing)"
             self.status_label.color = (0.3, 0.9, 0.3, 1) # Green for success
-            Clock.schedule_once(self.clear_insert_fields, 0.1) # Clear fields shortly after
-            Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', ''), 5) # Clear status message after 5s
-        except Exception as e:
-            self.status_label.text = f"Firebase Error: {e}"
-            self.status_label.color = (0.9, 0.3, 0.3, 1) # Red for error
-            print(f"Firebase insertion error: {e}") # Log detailed error
-            self.show_popup("Firebase Error", f"Could not insert tip: {e}")
-        finally:
-            # Re-enable button if it was disabled (Optional)
-            # instance.disabled = False
-            pass
+        else:
+            self.status_label.text = f"Tip saved offline. ID: {tip_id[:8]}... (will sync when connected)"
+            self.status_label.color = (0.9, 0.7, 0.3, 1) # Orange: queued only
+        self.last_inserted_tip_id = tip_id
+        Clock.schedule_once(self.clear_insert_fields, 0.1) # Clear fields shortly after
 
     def clear_insert_fields(self, dt):
         """Clears the text in all input fields after successful insertion."""
@@ -347,6 +2776,68 @@ class MainApp(App):
         if hasattr(self, 'live_input'):
             self.live_input.text = "No"
 
+    def show_analytics(self, instance):
+        """Switches to the analytics dashboard and recomputes it over the cached tips."""
+        self.data_access.new_view()
+        self._show_screen('analytics', self._build_analytics_view)
+        self._request_analytics_frame()
+
+    def _build_analytics_view(self):
+        self.analytics_view = AnalyticsView(on_load_history=self.load_full_history)
+        return self.analytics_view
+
+    def _request_analytics_frame(self):
+        self.data_access.request(('analytics_frame',), self.load_tips_frame, on_result=self._on_analytics_frame)
+
+    def load_tips_frame(self):
+        """Builds the column arrays from the local cache (runs on the data access pool)."""
+        return TipsFrame(self.tips_cache.load_columns())
+
+    def _on_analytics_frame(self, frame, error):
+        if error:
+            self.analytics_view.show_message(str(error))
+            return
+        self.analytics_view.set_frame(frame)
+
+    def load_full_history(self):
+        """Pulls every tip older than what the cache already covers, then rebuilds the dashboard."""
+        if not self.repository.starting and not self.repository.wait_ready(0):
+            self.analytics_view.show_message("Firebase not initialized.")
+            return
+        self.analytics_view.show_message("Downloading history...")
+        self.data_access.request(('backfill',), self.backfill_tips_history, on_result=self._on_history_loaded)
+
+    def _on_history_loaded(self, count, error):
+        if error:
+            self.analytics_view.show_message(f"Error loading history: {error}")
+            return
+        self._request_analytics_frame()
+
+    def backfill_tips_history(self, page_size=MAX_BATCH_WRITES):
+        """Copies the tips past the cache's oldest all-users page into the cache, page by page.
+
+        `history_oldest` remembers how far back the cache is known to be
+        complete for all users, so an interrupted backfill resumes there.
+        """
+        if self.tips_cache.get_meta('history_complete'):
+            return 0
+        if not self.repository.wait_ready():
+            raise RuntimeError("Firebase not initialized.")
+        cursor = self.tips_cache.get_meta('history_oldest')
+        if cursor is not None:
+            cursor = tuple(cursor)  # Stored as a JSON list
+        count = 0
+        while True:
+            page = self.repository.fetch_page(None, cursor, page_size)
+            self.tips_cache.upsert_tips(page)
+            count += len(page)
+            if page:
+                cursor = page[-1].page_key
+                self.tips_cache.set_meta('history_oldest', cursor)
+            if len(page) < page_size:
+                self.tips_cache.set_meta('history_complete', True)
+                return count
+
     def show_popup(self, title, message):
         """Displays a simple popup message."""
         content = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
@@ -358,358 +2849,478 @@ class MainApp(App):
         close_button.bind(on_press=popup.dismiss)
         popup.open()
 
+    def _build_tips_screen(self):
+        """Builds the tips screen's parts once; _show_tips_parts picks the ones a view needs."""
+        self.tips_layout = BoxLayout(orientation='vertical', spacing=dp(20))
+        self.tips_message_label = Label(font_size='18sp', size_hint_y=None, height=dp(50))
+
+        self.user_filter_label = Label(
+            font_size='16sp',
+            color=(0.8, 0.8, 1, 1),
+            size_hint_y=None,
+            height=dp(30)
+        )
+        clear_filter_btn = Button(
+            text="Show All Tips",
+            size_hint=(None, None),
+            size=(dp(120), dp(30)),
+            pos_hint={'center_x': 0.5},
+            background_normal='',
+            background_color=(0.4, 0.4, 0.6, 1),
+            color=(1, 1, 1, 1)
+        )
+        clear_filter_btn.bind(on_press=lambda x: self.show_tips(None))
+        self.user_filter_box = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(70), spacing=dp(10))
+        self.user_filter_box.add_widget(self.user_filter_label)
+        self.user_filter_box.add_widget(clear_filter_btn)
+
+        # Field filters and the team search are answered by the local index
+        self.filter_bar = FilterBar(on_change=self.apply_tip_filters)
+        # Only the rows visible in the viewport get widgets; they are reused while scrolling
+        self.tips_table = TipsTable(on_near_end=self.load_next_tips_page)
+
+        # Total profit display of the filtered user
+        self.totals_layout = BoxLayout(
+            orientation='horizontal',
+            size_hint=(1, None),
+            height=dp(50),
+            padding=[dp(10), dp(5)]
+        )
+        self.stats_label = Label(size_hint_x=0.7, font_size='14sp', color=(0.8, 0.8, 0.8, 1))
+        self.total_label = Label(
+            size_hint_x=0.3,
+            font_size='18sp',
+            bold=True
+        )
+        self.totals_layout.add_widget(self.stats_label)
+        self.totals_layout.add_widget(self.total_label)
+
+        self.tips_parts = [self.tips_message_label, self.user_filter_box, self.filter_bar,
+                           self.tips_table, self.totals_layout]
+        return self.tips_layout
+
+    def _show_tips_parts(self, *parts):
+        """Shows only the given parts of the tips screen, in their fixed order."""
+        wanted = [part for part in self.tips_parts if part in parts]
+        if self.tips_layout.children[::-1] != wanted:
+            self.tips_layout.clear_widgets()  # Only detaches; the widgets are reused
+            for part in wanted:
+                self.tips_layout.add_widget(part)
+
+    def _show_tips_message(self, text, error=False):
+        self.tips_message_label.text = text
+        self.tips_message_label.color = (0.9, 0.5, 0.5, 1) if error else (1, 1, 1, 1)
+        if self.tips_user_filter:
+            self._show_tips_parts(self.tips_message_label, self.user_filter_box)
+        else:
+            self._show_tips_parts(self.tips_message_label)
+
     def show_tips(self, instance):
-        """Clears the layout and displays the list of tips from Firebase."""
-        self.main_layout.clear_widgets()
-        self.create_top_buttons() # Re-add top buttons
-        if FIREBASE_INITIALIZED and db:
-            self.loading_label = Label(text="Loading tips...", font_size='18sp', size_hint_y=None, height=dp(50))
-            self.main_layout.add_widget(self.loading_label)
-            threading.Thread(target=lambda: self.fetch_tips_from_firebase(), daemon=True).start()
+        """Switches to the tips screen and shows all tips (cached ones first)."""
+        ui_trace.begin('show_tips')
+        self.screen_manager.current = 'tips'
+        self._start_tips_view(None)
+
+    def _start_tips_view(self, user_filter):
+        """Shows the cached tips for a new view at once, then syncs the cache in the background."""
+        # Requests of the previous view are cancelled or, if already running, never delivered
+        self.data_access.new_view()
+        self.tips_user_filter = user_filter
+        self.tips_cursor = None
+        self.tips_has_more = False
+        self.tips_page_loading = True
+        self.tips_data = []
+        self.filter_bar.reset()
+        self.tips_filters = {}
+        self.tips_results = None
+        self.tips_history_requested = False
+        self.user_filter_label.text = f"Showing tips for {user_filter}" if user_filter else ''
+        with ui_trace.span('model'):
+            cached_tips = self.tips_cache.load_tips(user_filter, limit=TIPS_PAGE_SIZE)
+        if not cached_tips:
+            # Cached tips are shown even when Firebase is unavailable
+            self._show_tips_message(f"Loading tips for {user_filter}..." if user_filter else "Loading tips...")
         else:
-            self.main_layout.add_widget(Label(
-                text="Firebase not initialized or connection error.\nPlease check service key path and network.",
-                font_size='16sp', color=(0.9, 0.5, 0.5, 1)
-            ))
-
-    def fetch_tips_from_firebase(self, user_filter=None):
-        """Fetches tip data from Firestore with optional user filter."""
-        tips_data = []
+            self.display_tips(cached_tips, None, user_filter)
+            self.tips_cursor = cached_tips[-1].page_key
+            self.tips_has_more = True
+            if self.tips_listener.active:
+                # The listener already keeps the cache current; no need to sync
+                self.tips_page_loading = False
+                return
+        self.data_access.request(
+            ('sync',), self.sync_tips_cache,
+            on_result=lambda changed, error: self._on_tips_synced(changed, error, user_filter)
+        )
+
+    def sync_tips_cache(self):
+        """Fetches only the tips inserted or changed since the last sync and merges them into the cache.
+
+        Runs on the data access pool; returns whether anything changed.
+        """
+        if not self.repository.wait_ready():
+            raise RuntimeError("Firebase not initialized.")
+        newest = self.tips_cache.newest_inserted_at()
+        if newest is None:
+            return False
+        # Tips written before `updated_at` existed fall back to the newest insertion time
+        last_sync = self.tips_cache.get_meta('last_sync', newest)
+        with ui_trace.span('fetch'):
+            synced = self.repository.fetch_inserted_after(newest)
+            synced.extend(self.repository.fetch_updated_after(last_sync))
+
+        with ui_trace.span('cache'):
+            self.tips_cache.upsert_tips(synced)
+        seen = [tip.updated_at or 0 for tip in synced]
+        self.tips_cache.set_meta('last_sync', max(seen + [last_sync]))
+        return bool(synced)
+
+    def _on_tips_synced(self, changed, error, user_filter):
+        """Refreshes the current view from the cache once the background sync is done."""
+        if not self.tips_data:
+            if not self.repository.wait_ready(0):
+                startup_timer.mark('first_data')
+                self._show_tips_message(
+                    "Firebase not initialized or connection error.\nPlease check service key path and network.",
+                    error=True
+                )
+                return
+            # Nothing cached for this view yet: fall back to fetching the first page
+            self._request_tips_page(user_filter, None)
+            return
+        self.tips_page_loading = False
+        if error:
+            print(f"Showing cached tips: Error syncing tips: {error}")
+        elif changed:
+            # The index rebuild re-applies any active filters
+            self.tips_index = None
+            self._load_tips_index()
+            if self.tips_filters:
+                return
+            with ui_trace.span('model'):
+                tips_data = self.tips_cache.load_tips(user_filter, limit=len(self.tips_data))
+            self.tips_data = tips_data
+            if not tips_data:
+                # The sync removed every tip this view showed
+                self.tips_cursor = None
+                self.tips_has_more = False
+                self.display_tips(tips_data, None, user_filter)
+                return
+            self.tips_cursor = tips_data[-1].page_key
+            with ui_trace.span('widgets'):
+                self.tips_table.set_tips(tips_data)
+
+    def load_next_tips_page(self):
+        """Loads the page after the last shown tip, from the cache if possible, otherwise from Firebase."""
+        if self.tips_filters:
+            # Filtered views page through the index results instead
+            more = self.tips_results.next_page(TIPS_PAGE_SIZE) if self.tips_results else []
+            if more:
+                self.tips_cursor = more[-1].page_key
+                self.tips_data.extend(more)
+                self.tips_table.append_tips(more)
+            return
+        if self.tips_page_loading or not self.tips_has_more:
+            return
+        cached_tips = self.tips_cache.load_tips(self.tips_user_filter, before=self.tips_cursor, limit=TIPS_PAGE_SIZE)
+        if cached_tips:
+            self.tips_cursor = cached_tips[-1].page_key
+            self.tips_data.extend(cached_tips)
+            self.tips_table.append_tips(cached_tips)
+            if len(cached_tips) == TIPS_PAGE_SIZE:
+                return
+        self._request_tips_page(self.tips_user_filter, self.tips_cursor)
+
+    def _request_tips_page(self, user_filter, cursor):
+        self.tips_page_loading = True
+        self.data_access.request(
+            ('page', user_filter, cursor), self.fetch_tips_page, user_filter, cursor,
+            on_result=lambda tips_data, error: self._on_tips_page(tips_data, error, user_filter, cursor)
+        )
+
+    def fetch_tips_page(self, user_filter=None, cursor=None):
+        """Fetches one page of tips from the repository with optional user filter.
+
+        `cursor` is the `page_key` of the last tip already shown; the query
+        resumes right after it, so only the new page crosses
+        the network. Fetched tips are also stored in the local cache.
+        """
+        if not self.repository.wait_ready():
+            raise RuntimeError("Firebase not initialized.")
+        with ui_trace.span('fetch'):
+            tips_data = self.repository.fetch_page(user_filter, cursor, TIPS_PAGE_SIZE)
+        with ui_trace.span('cache'):
+            self.tips_cache.upsert_tips(tips_data)
+        if not user_filter and tips_data:
+            # All-users pages extend the range the cache holds completely
+            oldest = self.tips_cache.get_meta('history_oldest')
+            if oldest is not None:
+                oldest = tuple(oldest)  # Stored as a JSON list
+            if cursor == oldest:
+                self.tips_cache.set_meta('history_oldest', tips_data[-1].page_key)
+        return tips_data
+
+    def _on_tips_page(self, tips_data, error, user_filter, cursor):
+        """Routes a fetched page to the right place on the main thread."""
+        self.tips_page_loading = False
         error_message = None
-        try:
-            # Base query
-            query = db.collection('tips')
-            
-            # Apply filters based on user_filter
-            if user_filter:
-                # When filtering by user, order by inserted_at after the filter
-                query = query.where('user', '==', user_filter)
-                query = query.order_by('inserted_at', direction=firestore.Query.DESCENDING)
-            else:
-                # When showing all tips, just order by inserted_at
-                query = query.order_by('inserted_at', direction=firestore.Query.DESCENDING)
-            
-            # Execute query with limit
-            tips_query = query.limit(50).stream()
-            for tip_doc in tips_query:
-                tip_dict = tip_doc.to_dict()
-                tips_data.append({'id': tip_doc.id, 'data': tip_dict})
-        except Exception as e:
-            error_message = f"Error fetching tips: {e}"
+        if error:
+            error_message = f"Error fetching tips: {error}"
             print(error_message)
-        Clock.schedule_once(lambda dt: self.display_tips(tips_data, error_message, user_filter), 0)
+            tips_data = []
+        if tips_data:
+            self.tips_cursor = tips_data[-1].page_key
+        self.tips_has_more = len(tips_data) == TIPS_PAGE_SIZE
+        if cursor is None:
+            self.display_tips(tips_data, error_message, user_filter)
+        elif error_message:
+            self.show_popup("Error", error_message)
+        else:
+            # A tip can already be shown if it was in the cache; only append the new ones
+            shown_ids = {tip.id for tip in self.tips_data}
+            new_tips = [tip for tip in tips_data if tip.id not in shown_ids]
+            self.tips_data.extend(new_tips)
+            self.tips_table.append_tips(new_tips)
 
     def display_tips(self, tips_data, error_message, user_filter=None):
-        """Updates the UI to display the fetched tips with optional filter."""
-        """Updates the UI to display the fetched tips or an error message."""
-        if hasattr(self, 'loading_label') and self.loading_label.parent:
-            self.main_layout.remove_widget(self.loading_label)
-
+        """Updates the tips screen in place to show the fetched tips or an error message."""
+        startup_timer.mark('first_data')
+        self.tips_user_filter = user_filter
         if error_message:
-            self.main_layout.add_widget(Label(text=error_message, font_size='16sp', color=(0.9, 0.5, 0.5, 1)))
+            self._show_tips_message(error_message, error=True)
+            self._finish_interaction_on_next_frame()
             return
         if not tips_data:
-            no_tips_label = Label(
-                text=f"No tips found{f' for user {user_filter}' if user_filter else ''}.",
-                font_size='16sp'
-            )
-            self.main_layout.add_widget(no_tips_label)
+            self._show_tips_message(f"No tips found{f' for user {user_filter}' if user_filter else ''}.")
+            self._finish_interaction_on_next_frame()
+            return
+
+        self.tips_data = list(tips_data)
+        with ui_trace.span('widgets'):
+            self.tips_table.set_tips(tips_data)
             if user_filter:
-                clear_filter_btn = Button(
-                    text="Clear Filter", size_hint=(None, None),
-                    size=(dp(120), dp(40)), pos_hint={'center_x': 0.5},
-                    background_normal='', background_color=(0.4, 0.4, 0.6, 1),
-                    color=(1, 1, 1, 1)
-                )
-                clear_filter_btn.bind(on_press=lambda x: self.show_tips(None))
-                self.main_layout.add_widget(clear_filter_btn)
+                self._show_tips_parts(self.user_filter_box, self.filter_bar, self.tips_table, self.totals_layout)
+                self._update_total_profit()
+            else:
+                self._show_tips_parts(self.filter_bar, self.tips_table)
+        self._finish_interaction_on_next_frame()
+        self._load_tips_index()
+        if user_filter:
+            self._load_user_stats(user_filter)
+
+    def _load_tips_index(self):
+        if self.tips_index is not None:
+            self._on_tips_index(self.tips_index, None)
             return
+        self.data_access.request(('tips_index',), self.build_tips_index, on_result=self._on_tips_index)
 
-        scrollview = ScrollView(size_hint=(1, 1), bar_width=dp(10), scroll_type=['bars', 'content'])
-        table_layout = GridLayout(
-            cols=10,  # Increased for new Odd column
-            size_hint_y=None,
-            spacing=dp(2),
-            padding=dp(10),
-            row_default_height=dp(35),
-            row_force_default=True
-        )
-        table_layout.bind(minimum_height=table_layout.setter('height'))
-        headers = ["User", "Team1", "Team2", "Bet", "Competition", "Date", "Value", "Odd", "Profit", "Actions"]
-        header_bg_color = (0.4, 0.4, 0.4, 1)
+    def build_tips_index(self):
+        """Indexes every cached tip (runs on the data access pool)."""
+        return TipsIndex(self.tips_cache.load_tips())
 
-        for header in headers:
-            header_label = Label(
-                text=header, bold=True, font_size='16sp',
-                size_hint_y=None, height=dp(40)
-            )
-            with header_label.canvas.before:
-                Color(*header_bg_color)
-                header_label._header_bg = Rectangle(pos=header_label.pos, size=header_label.size)
-            header_label.bind(
-                pos=lambda instance, value: setattr(instance._header_bg, 'pos', instance.pos) if hasattr(instance, '_header_bg') else None,
-                size=lambda instance, value: setattr(instance._header_bg, 'size', instance.size) if hasattr(instance, '_header_bg') else None
-            )
-            table_layout.add_widget(header_label)
+    def _on_tips_index(self, index, error):
+        if error:
+            print(f"Error indexing tips: {error}")
+            return
+        self.tips_index = index
+        self.filter_bar.set_choices(index.values('sport'), index.values('competition'))
+        if self.tips_filters:
+            self.apply_tip_filters(self.tips_filters)
 
-        row_colors = [(0.22, 0.22, 0.22, 1), (0.20, 0.20, 0.20, 1)]
+    def apply_tip_filters(self, criteria):
+        """Shows the tips matching the filter bar, answered from the local index."""
+        self.tips_filters = criteria
+        if not criteria:
+            # Back to the paged view of the cache
+            self.filter_bar.set_status('')
+            tips = self.tips_cache.load_tips(self.tips_user_filter, limit=TIPS_PAGE_SIZE)
+            self.tips_has_more = True
+        elif self.tips_index is None:
+            self.filter_bar.set_status('Indexing...')
+            return
+        else:
+            if self.tips_user_filter:
+                criteria = dict(criteria, user=self.tips_user_filter)
+            started = time.perf_counter()
+            self.tips_results = self.tips_index.query(criteria)
+            tips = self.tips_results.next_page(TIPS_PAGE_SIZE)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.filter_bar.set_status(f"{len(self.tips_results)} of {len(self.tips_index)} ({elapsed_ms:.0f} ms)")
+            self._backfill_for_filters()
+        self.tips_data = list(tips)
+        self.tips_cursor = tips[-1].page_key if tips else None
+        self.tips_table.set_tips(tips)
 
-        # Add filter indicator if active
-        if user_filter:
-            filter_label = Label(
-                text=f"Showing tips for {user_filter}",
-                font_size='16sp',
-                color=(0.8, 0.8, 1, 1),
-                size_hint_y=None,
-                height=dp(30)
-            )
-            clear_filter_btn = Button(
-                text="Show All Tips",
-                size_hint=(None, None),
-                size=(dp(120), dp(30)),
-                pos_hint={'center_x': 0.5},
-                background_normal='',
-                background_color=(0.4, 0.4, 0.6, 1),
-                color=(1, 1, 1, 1)
-            )
-            clear_filter_btn.bind(on_press=lambda x: self.show_tips(None))
-            filter_box = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(70), spacing=dp(10))
-            filter_box.add_widget(filter_label)
-            filter_box.add_widget(clear_filter_btn)
-            self.main_layout.add_widget(filter_box)
-
-        for i, tip_item in enumerate(tips_data):
-            tip_id = tip_item['id']
-            tip = tip_item['data']
-            bg_color = row_colors[i % 2]
-            user_name = tip.get('user', 'N/A')
-            data_points = [
-                user_name,
-                tip.get('team1', 'N/A'),
-                tip.get('team2', 'N/A'),
-                tip.get('bet', 'N/A'),
-                tip.get('competition', 'N/A'),
-                tip.get('date', 'N/A'),
-                str(tip.get('value', 'N/A')),
-                str(tip.get('odd', 'N/A')),
-                str((float(tip.get('value', 0)) * float(tip.get('odd', 0))) - float(tip.get('value', 0))) if tip.get('status') == 'Win'
-                    else str(-float(tip.get('value', 0))) if tip.get('status') == 'Loose'
-                    else 'Pending'
-            ]
-
-            for i_data, data in enumerate(data_points):
-                # Create cell widget (button for username, label for others)
-                if i_data == 0 and data != "User":  # First column (username) but not header
-                    cell = Button(
-                        text=data,
-                        font_size='14sp',
-                        size_hint_y=None,
-                        height=dp(30),
-                        halign='center',
-                        valign='middle',
-                        background_normal='',
-                        background_down='',
-                        background_color=(0, 0, 0, 0),
-                        color=(0.8, 0.8, 1, 1)  # Light blue text for username
-                    )
-                    cell.bind(on_press=lambda btn, name=data: self.filter_tips_by_user(name))
-                else:
-                    cell = Label(
-                        text=data,
-                        font_size='14sp',
-                        size_hint_y=None,
-                        height=dp(30),
-                        halign='center',
-                        valign='middle'
-                    )
-
-                # Add background to cell
-                with cell.canvas.before:
-                    Color(*bg_color)
-                    cell._bg = Rectangle(pos=cell.pos, size=cell.size)
-                
-                # Bind position and size updates
-                cell.bind(
-                    pos=lambda instance, value: setattr(instance._bg, 'pos', instance.pos),
-                    size=lambda instance, value: setattr(instance._bg, 'size', instance.size)
-                )
-                
-                # Set cell text size for proper text alignment
-                if isinstance(cell, Label):
-                    cell.text_size = (None, dp(30))
-                    cell.shorten = True
-                    cell.shorten_from = 'right'
-                
-                # Add cell to table
-                table_layout.add_widget(cell)
-
-            # --- Add Action Buttons with conditional display ---
-            action_layout = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=dp(35))  # Increased height and spacing
-            tip_status = tip.get('status', 'Pending')
-            
-            if tip_status == 'Win':
-                # Show disabled Win status button with subtle animation
-                status_button = Button(
-                    text="✓ WIN", font_size='14sp', size_hint_x=1,
-                    background_normal='', background_down='',
-                    background_color=(0.2, 0.7, 0.2, 0.9),  # More solid green
-                    color=(1, 1, 1, 0.9),  # Slightly transparent white text
-                    bold=True,
-                    disabled=True
-                )
-                add_rounded_background(status_button, (0.2, 0.7, 0.2, 0.9), radius_dp=8)
-                action_layout.add_widget(status_button)
-            elif tip_status == 'Loose':  # Keeping 'Loose' for consistency with existing data
-                # Show disabled Loose status button with subtle animation
-                status_button = Button(
-                    text="✗ LOOSE", font_size='14sp', size_hint_x=1,
-                    background_normal='', background_down='',
-                    background_color=(0.8, 0.3, 0.3, 0.9),  # More solid red
-                    color=(1, 1, 1, 0.9),  # Slightly transparent white text
-                    bold=True,
-                    disabled=True
-                )
-                add_rounded_background(status_button, (0.8, 0.3, 0.3, 0.9), radius_dp=8)
-                action_layout.add_widget(status_button)
-            else:  # Pending status
-                # Win button with hover effect
-                win_button = Button(
-                    text="WIN", font_size='14sp', size_hint_x=0.5,
-                    background_normal='', background_down='',
-                    background_color=(0.2, 0.7, 0.2, 0.8),
-                    color=(1, 1, 1, 0.9),
-                    bold=True
-                )
-                add_rounded_background(win_button, (0.2, 0.7, 0.2, 0.8), radius_dp=8)
-                win_button.bind(
-                    on_press=lambda instance, t_id=tip_id: self.update_tip_status(t_id, 'Win', instance),
-                    on_release=lambda instance: setattr(instance, 'background_color', (0.2, 0.7, 0.2, 0.8))
-                )
-                
-                # Loose button with hover effect
-                loose_button = Button(
-                    text="LOOSE", font_size='14sp', size_hint_x=0.5,
-                    background_normal='', background_down='',
-                    background_color=(0.8, 0.3, 0.3, 0.8),
-                    color=(1, 1, 1, 0.9),
-                    bold=True
-                )
-                add_rounded_background(loose_button, (0.8, 0.3, 0.3, 0.8), radius_dp=8)
-                loose_button.bind(
-                    on_press=lambda instance, t_id=tip_id: self.update_tip_status(t_id, 'Loose', instance),
-                    on_release=lambda instance: setattr(instance, 'background_color', (0.8, 0.3, 0.3, 0.8))
-                )
-                
-                action_layout.add_widget(win_button)
-                action_layout.add_widget(loose_button)
-
-            # Add background to action layout
-            with action_layout.canvas.before:
-                Color(*bg_color)
-                action_layout._bg = Rectangle(pos=action_layout.pos, size=action_layout.size)
-            action_layout.bind(
-                pos=lambda instance, value: setattr(instance._bg, 'pos', instance.pos),
-                size=lambda instance, value: setattr(instance._bg, 'size', instance.size)
-            )
+    def _backfill_for_filters(self):
+        """Filters only see cached tips, so pull in the rest of the history (once per view)."""
+        if self.tips_history_requested or self.tips_cache.get_meta('history_complete'):
+            return
+        self.tips_history_requested = True
+        self.data_access.request(('backfill',), self.backfill_tips_history, on_result=self._on_filter_history_loaded)
+
+    def _on_filter_history_loaded(self, count, error):
+        if error:
+            print(f"Error loading history: {error}")
+        elif count:
+            self.tips_index = None
+            self._load_tips_index()
 
-            # Add to table
-            table_layout.add_widget(action_layout)
+    def _update_total_profit(self):
+        """Shows the filtered user's aggregates (mirrored from `user_stats`, so O(1))."""
+        if not self.tips_user_filter:
+            return
+        stats = self.tips_cache.get_user_stats(self.tips_user_filter)
+        if not stats:
+            self.total_label.text = "Total Profit: ..."
+            self.stats_label.text = ""
+            return
+        total_profit = stats.get('profit', 0)
+        self.total_label.text = f"Total Profit: {total_profit:.2f}"
+        self.total_label.color = (0.3, 0.9, 0.3, 1) if total_profit >= 0 else (0.9, 0.3, 0.3, 1)
+        rate = win_rate(stats)
+        self.stats_label.text = (
+            f"Staked: {stats.get('staked', 0):.2f}   "
+            f"Win rate: {'-' if rate is None else f'{rate:.0%}'}   "
+            f"W/L/P: {stats.get('win', 0)}/{stats.get('loose', 0)}/{stats.get('pending', 0)}"
+        )
 
-        scrollview.add_widget(table_layout)
-        self.main_layout.add_widget(scrollview)
+    def _load_user_stats(self, user):
+        """Makes sure the cached aggregates of `user` are complete, rebuilding them if needed."""
+        stats = self.tips_cache.get_user_stats(user)
+        if stats and stats.get('complete') and self.tips_listener.active:
+            return  # The listener keeps complete aggregates current
+        self.data_access.request(('user_stats', user), self.fetch_user_stats, user, on_result=self._on_user_stats)
 
-        # Calculate total profit for filtered user view
-        if user_filter:
-            total_profit = 0
-            for tip_item in tips_data:
-                tip = tip_item['data']
-                if tip.get('status') == 'Win':
-                    total_profit += (float(tip.get('value', 0)) * float(tip.get('odd', 0))) - float(tip.get('value', 0))
-                elif tip.get('status') == 'Loose':
-                    total_profit -= float(tip.get('value', 0))
-
-            # Create total profit display
-            total_layout = BoxLayout(
-                orientation='horizontal',
-                size_hint=(1, None),
-                height=dp(50),
-                padding=[dp(10), dp(5)]
-            )
-            spacer = Widget(size_hint_x=0.7)  # Push total to the right
-            total_label = Label(
-                text=f"Total Profit: {total_profit:.2f}",
-                size_hint_x=0.3,
-                font_size='18sp',
-                bold=True,
-                color=(0.3, 0.9, 0.3, 1) if total_profit >= 0 else (0.9, 0.3, 0.3, 1)
-            )
-            total_layout.add_widget(spacer)
-            total_layout.add_widget(total_label)
-            self.main_layout.add_widget(total_layout)
+    def _on_user_stats(self, stats, error):
+        if error:
+            print(f"Error loading user stats: {error}")
+            return
+        self._update_total_profit()
+
+    def fetch_user_stats(self, user):
+        """Reads the `user_stats` document of a user, backfilling it from the user's tips if incomplete.
+
+        Aggregates are only incremented from the moment they were introduced,
+        so documents without `complete` are recomputed once from all tips
+        (atomically with the commits that increment them, see rebuild_user_stats).
+        """
+        if not self.repository.wait_ready():
+            raise RuntimeError("Firebase not initialized.")
+        stats = self.repository.get_user_stats(user)
+        if not stats or not stats.get('complete'):
+            stats = self.repository.rebuild_user_stats(user)
+        self.tips_cache.set_user_stats(user, stats)
+        return stats
+
+    def apply_stats_changes(self, users):
+        """Refreshes the totals when the aggregates of the filtered user change."""
+        if self.tips_user_filter in users:
+            self._update_total_profit()
 
     def filter_tips_by_user(self, username):
         """Shows tips filtered for a specific user."""
-        self.main_layout.clear_widgets()
-        self.create_top_buttons()
-        
-        # Show loading state
-        self.loading_label = Label(
-            text=f"Loading tips for {username}...",
-            font_size='18sp',
-            size_hint_y=None,
-            height=dp(50)
-        )
-        self.main_layout.add_widget(self.loading_label)
-        
-        # Start fetching in background thread
-        threading.Thread(
-            target=self.fetch_tips_from_firebase,
-            kwargs={'user_filter': username},
-            daemon=True
-        ).start()
+        ui_trace.begin('filter_user', user=username)
+        self.screen_manager.current = 'tips'
+        self._start_tips_view(username)
 
     def update_tip_status(self, tip_id, new_status, button_instance=None):
-        """Starts a background thread to update the status of a tip in Firebase."""
-        if not FIREBASE_INITIALIZED or not db:
-            self.show_popup("Error", "Firebase not initialized.")
-            return
-
+        """Queues a status update for a tip and shows it locally right away."""
         if button_instance and button_instance.parent:
             for child in button_instance.parent.children:
                 if isinstance(child, Button):
                     child.disabled = True
+        # Rows are recycled, so the busy state has to live outside the row widget
+        self.updating_tip_ids.add(tip_id)
 
-        threading.Thread(
-            target=self._update_tip_in_background,
-            args=(tip_id, new_status, button_instance),
-            daemon=True
-        ).start()
+        tip = self.tips_cache.get_tip(tip_id)
+        self.write_queue.enqueue_status(tip_id, new_status, tip)
+        if tip:
+            tip = tip.replace(status=new_status)
+            self.tips_cache.upsert_tips([tip], pending=self.tips_cache.is_pending(tip_id))
+            self.apply_tip_changes([('MODIFIED', tip)])
 
-    def _update_tip_in_background(self, tip_id, new_status, button_instance):
-        """Performs the Firestore update in a background thread."""
-        success = False
-        error_message = None
-        try:
-            tip_ref = db.collection('tips').document(tip_id)
-            tip_ref.update({'status': new_status})
-            success = True
-            print(f"Successfully updated tip {tip_id} to status {new_status}")
-        except Exception as e:
-            error_message = f"Error updating tip {tip_id}: {e}"
-            print(error_message)
-        Clock.schedule_once(lambda dt: self._update_tip_callback(success, error_message, button_instance), 0)
+    def _on_writes_committed(self, ops):
+        """Clears the busy state of tips whose queued writes reached Firestore."""
+        for op in ops:
+            self.updating_tip_ids.discard(op['id'])
+            if op['op'] == 'insert' and op['id'] == getattr(self, 'last_inserted_tip_id', None):
+                if hasattr(self, 'status_label') and self.status_label.text:
+                    self.status_label.text = f"Tip inserted successfully! ID: {op['id'][:8]}..."
+                    self.status_label.color = (0.3, 0.9, 0.3, 1)
+                    Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', ''), 5) # Clear status message after 5s
+            # The snapshot listener delivers the server copy and redraws the row
+            if not self.tips_listener.active:
+                self._refresh_tip_row(op['id'])
 
-    def _update_tip_callback(self, success, error_message, button_instance):
-        if button_instance and button_instance.parent:
-             for child in button_instance.parent.children:
-                if isinstance(child, Button):
-                    child.disabled = False
-
-        if success:
-            self.show_tips(None)
+    def _on_write_failed(self, op, error):
+        """Rolls back the local copy of a write Firestore rejected for good."""
+        self.updating_tip_ids.discard(op['id'])
+        tip = self.tips_cache.get_tip(op['id'])
+        if isinstance(error, StatusConflict):
+            # Settled differently elsewhere: show the stored tip instead of ours
+            self.tips_cache.upsert_tips([error.tip])
+            self.apply_tip_changes([('MODIFIED', error.tip)])
+            self.show_popup("Update Conflict", f"Tip {op['id'][:8]}... was already marked {error.tip.status} "
+                                               f"elsewhere; your change to {op['status']} was not saved.")
+            return
+        if op['op'] == 'insert' or self.repository.is_not_found(error) or not tip:
+            self.tips_cache.delete_tips([op['id']])
+            self.apply_tip_changes([('REMOVED', Tip(op['id']))])
         else:
-            self.show_popup("Update Error", error_message or "Failed to update tip status.")
+            # Status can only be changed from the pending state in the UI
+            tip = tip.replace(status='Pending')
+            self.tips_cache.upsert_tips([tip])
+            self.apply_tip_changes([('MODIFIED', tip)])
+        self.show_popup("Update Error", f"Could not save tip {op['id'][:8]}...: {error}")
+
+    def _refresh_tip_row(self, tip_id):
+        """Redraws the row of a tip from the cache (e.g. to clear its busy state)."""
+        for index, tip in enumerate(self.tips_data):
+            if tip.id == tip_id:
+                self.tips_table.update_row(index, tip)
+                return
+
+    def apply_tip_changes(self, changes):
+        """Applies document-level diffs from the snapshot listener to the current view."""
+        if self.tips_index is not None:
+            self.tips_index.apply(changes)
+        positions = {tip.id: index for index, tip in enumerate(self.tips_data)}
+        for kind, tip in changes:
+            index = positions.get(tip.id)
+            if kind == 'REMOVED':
+                if index is not None:
+                    del self.tips_data[index]
+                    self.tips_table.remove_row(index)
+                    positions = {t.id: i for i, t in enumerate(self.tips_data)}
+            elif index is not None:
+                # Skip the redraw when the server echoes what is already shown
+                if tip_to_row_data(tip) != tip_to_row_data(self.tips_data[index]) or tip.id in self.updating_tip_ids:
+                    self.tips_table.update_row(index, tip)
+                self.tips_data[index] = tip
+            elif self._tip_belongs_to_view(tip):
+                # New tip: insert it where it belongs in the newest-first order
+                index = 0
+                while index < len(self.tips_data) and self.tips_data[index].inserted_at > tip.inserted_at:
+                    index += 1
+                self.tips_data.insert(index, tip)
+                self.tips_table.insert_row(index, tip)
+                positions = {t.id: i for i, t in enumerate(self.tips_data)}
+        if self.tips_data and not self.tips_table.parent:
+            # The view was showing "No tips found" (or still loading)
+            self.display_tips(self.tips_data, None, self.tips_user_filter)
+
+    def _tip_belongs_to_view(self, tip):
+        """Whether a tip not yet shown falls inside the current view's filter and loaded range."""
+        if tip.inserted_at is None:
+            return False
+        if self.tips_user_filter and tip.user != self.tips_user_filter:
+            return False
+        if self.tips_filters and not tip_matches(tip, self.tips_filters):
+            return False
+        # Older tips than the last loaded one will arrive with the next page
+        return self.tips_cursor is None or tip.page_key >= self.tips_cursor
 
 # --- Run the App ---
 if __name__ == '__main__':
+    startup_timer.mark('imports')
     MainApp().run()
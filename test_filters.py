@@ -0,0 +1,63 @@
+"""Checks the TextInput filters against their original re.sub versions on random input.
+
+Run with `python -m pytest test_filters.py`.
+"""
+import os
+os.environ.setdefault('KIVY_NO_ARGS', '1')  # Keep Kivy away from pytest's command line
+
+import random
+import re
+
+import pytest
+
+from main import letters_and_space, date_filter, odd_filter
+
+CASES = 20000  # Random texts per filter
+SEED = 1
+
+# The filters as they were before they were compiled; the current ones must match them exactly
+def original_letters_and_space(text, from_undo):
+    return re.sub(r'[^A-Za-z\s]', '', text)
+
+def original_date_filter(text, from_undo):
+    text = re.sub(r'[^0-9\-]', '', text)
+    return text[:10]
+
+def original_odd_filter(text, from_undo):
+    if not text:
+        return ''
+    filtered = re.sub(r'[^0-9\.]', '', text)
+    parts = filtered.split('.')
+    if len(parts) > 2:
+        filtered = parts[0] + '.' + parts[1]
+    digits = filtered.replace('.', '')
+    if len(digits) > 4:
+        if '.' in filtered:
+            dec_pos = filtered.index('.')
+            filtered = filtered[:dec_pos + (5-dec_pos)]
+        else:
+            filtered = filtered[:4]
+    return filtered
+
+FILTERS = [
+    ('letters_and_space', letters_and_space, original_letters_and_space),
+    ('date_filter', date_filter, original_date_filter),
+    ('odd_filter', odd_filter, original_odd_filter),
+]
+# Weighted towards the characters the filters care about, plus some they must drop
+FILTER_ALPHABET = "0123456789" * 3 + "..--  \t\nabcXYZ,/éß٣\u00a0"
+
+def random_text(rng, max_length):
+    return ''.join(rng.choice(FILTER_ALPHABET) for _ in range(rng.randrange(max_length + 1)))
+
+@pytest.mark.parametrize('name, new, original', FILTERS, ids=[name for name, _, _ in FILTERS])
+def test_filter_matches_original(name, new, original):
+    rng = random.Random(SEED)
+    for _ in range(CASES):
+        text = random_text(rng, rng.choice((4, 12, 40)))
+        assert new(text, False) == original(text, False), f"{name}({text!r})"
+
+@pytest.mark.parametrize('name, new, original', FILTERS, ids=[name for name, _, _ in FILTERS])
+@pytest.mark.parametrize('text', ['', '.', '..', '-', '1.2.3', '12345', '1234.5678', '2024-01-01-01', '٣.٣'])
+def test_filter_edge_cases(name, new, original, text):
+    assert new(text, False) == original(text, False)
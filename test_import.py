@@ -0,0 +1,53 @@
+"""Checks that the streaming JSON array reader agrees with json.loads, whatever the chunk size.
+
+Run with `python -m pytest test_import.py`.
+"""
+import os
+os.environ.setdefault('KIVY_NO_ARGS', '1')  # Keep Kivy away from pytest's command line
+
+import io
+import json
+import random
+
+import pytest
+
+from main import _iter_json_array
+
+CASES = 200  # Random arrays per chunk size
+SEED = 1
+
+# Scalars split anywhere must not be decoded early ('2' of '2.5', '1e' of '1e5')
+SCALARS = [0, 1, -7, 2.5, -0.125, 1e21, 3.5e-7, True, False, None, "", "x y", "a, b]", "é ß", "\\\"", "[1, 2]"]
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(4 if depth < 2 else 2)
+    if kind == 0:
+        return rng.choice(SCALARS)
+    if kind == 1:
+        return rng.uniform(-1e6, 1e6) if rng.random() < 0.5 else rng.randrange(-10**9, 10**9)
+    if kind == 2:
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randrange(4))}
+
+def random_array(rng):
+    items = [random_value(rng) for _ in range(rng.randrange(8))]
+    separators = rng.choice([(',', ':'), (', ', ': '), (' ,\n ', ' :\t')])
+    return items, json.dumps(items, separators=separators)
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 4, 5, 7, 16])
+def test_iter_json_array_matches_json_loads(chunk_size):
+    rng = random.Random(SEED)
+    for _ in range(CASES):
+        items, text = random_array(rng)
+        assert list(_iter_json_array(io.StringIO(text), chunk_size)) == items, text
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 4])
+@pytest.mark.parametrize('text', ['[1, 2.5]', '[1e5,-2E-3 ]', '[true,false,null]', '[ 12345678901234567890 ]', '[]', ' [ ] '])
+def test_iter_json_array_edge_cases(text, chunk_size):
+    assert list(_iter_json_array(io.StringIO(text), chunk_size)) == json.loads(text)
+
+@pytest.mark.parametrize('chunk_size', [1, 3])
+@pytest.mark.parametrize('text', ['', '{}', '[1, 2', '[1 2.]', '[1, tru]'])
+def test_iter_json_array_rejects_invalid(text, chunk_size):
+    with pytest.raises(ValueError):
+        list(_iter_json_array(io.StringIO(text), chunk_size))